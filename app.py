@@ -6,22 +6,34 @@ Python桌面版姓名生成器主程序
 """
 
 import sys
-import os
 
-# 确保程序可以找到模块
-current_dir = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, current_dir)
 
-try:
-    from main_window import main
-except ImportError as e:
-    print(f"导入错误: {e}")
-    print("请确保已安装 PyQt5")
-    print("安装命令: pip install PyQt5")
-    sys.exit(1)
+def __getattr__(name):
+    """按需加载主界面入口，避免仅导入本模块时就加载PyQt5"""
+    if name != "main":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    # 打包环境中依赖必然存在，直接导入
+    if getattr(sys, 'frozen', False):
+        from main_window import main
+        return main
+    
+    try:
+        from main_window import main
+    except ImportError as e:
+        print(f"导入错误: {e}")
+        print("请确保已安装 PyQt5")
+        print("安装命令: pip install PyQt5")
+        sys.exit(1)
+    return main
 
 
 if __name__ == "__main__":
+    # 打包后VCF批量生成会启动子进程，子进程在此处理后直接退出
+    import multiprocessing
+    multiprocessing.freeze_support()
+    
+    main = __getattr__("main")
     try:
         exit_code = main()
         sys.exit(exit_code)
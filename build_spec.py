@@ -7,12 +7,9 @@ InfoGen打包脚本
 
 import sys
 import os
-import PyInstaller.__main__
-import argparse
 
-def create_spec_content():
-    """创建.spec文件内容"""
-    spec_content = '''# -*- mode: python ; coding: utf-8 -*-
+# .spec文件内容固定不变
+_SPEC_CONTENT = '''# -*- mode: python ; coding: utf-8 -*-
 
 import sys
 sys.setrecursionlimit(5000)
@@ -27,11 +24,8 @@ a = Analysis(
     hiddenimports=[
         'PyQt5.QtCore',
         'PyQt5.QtGui', 
-        'PyQt5.QtWidgets',
-        'name_generator',
-        'vcf_generator',
-        'main_window'
-    ],
+        'PyQt5.QtWidgets'
+    ],  # 应用自身模块由app.py的导入自动追踪，无需重复声明
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -41,7 +35,18 @@ a = Analysis(
         'pandas',
         'scipy',
         'PIL',
-        'tkinter'
+        'tkinter',
+        'PyQt5.QtNetwork',
+        'PyQt5.QtSql',
+        'PyQt5.QtXml',
+        'PyQt5.QtMultimedia',
+        'PyQt5.QtWebEngineCore',
+        'PyQt5.QtBluetooth',
+        'PyQt5.QtPositioning',
+        'PyQt5.QtSensors',
+        'PyQt5.QtQml',
+        'PyQt5.QtQuick',
+        'PyQt5.QtTest'
     ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
@@ -49,22 +54,35 @@ a = Analysis(
     noarchive=False,
 )
 
+# 过滤未使用的Qt动态库，减小体积并加快启动
+unused_qt_libs = (
+    'Qt5Network', 'Qt5Sql', 'Qt5Xml', 'Qt5Multimedia', 'Qt5WebEngine',
+    'Qt5Bluetooth', 'Qt5Positioning', 'Qt5Sensors', 'Qt5Qml', 'Qt5Quick', 'Qt5Test'
+)
+a.binaries = [b for b in a.binaries if not any(lib in b[0] for lib in unused_qt_libs)]
+
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
+# 目录模式：避免每次启动解压到临时目录，Qt核心库不做UPX压缩
+upx_exclude = [
+    'Qt5Core.dll',
+    'Qt5Gui.dll',
+    'Qt5Widgets.dll',
+    'python3*.dll',
+    'vcruntime*.dll'
+]
+
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='InfoGen',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
     upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
+    upx_exclude=upx_exclude,
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -73,19 +91,78 @@ exe = EXE(
     icon='app_icon.ico',
     version_file=None,
 )
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx=True,
+    upx_exclude=upx_exclude,
+    name='InfoGen',
+)
 '''
-    return spec_content
+
+# 写入及比较spec文件时使用的UTF-8字节，导入时预先编码一次
+_SPEC_BYTES = _SPEC_CONTENT.encode('utf-8')
+
+# 横幅与使用说明整体输出，减少写入次数
+_BANNER = (
+    "=" * 50 + "\n"
+    "   InfoGen v3.1 打包工具\n"
+    + "=" * 50 + "\n"
+)
+
+_USAGE = (
+    "\n" + "=" * 50 + "\n"
+    "📋 使用说明：\n"
+    "1. 程序目录已生成在 dist/InfoGen 下\n"
+    "2. InfoGen.exe 可以独立运行，无需Python环境\n"
+    "3. 运行时无需解压，启动速度更快\n"
+    "4. 分发时请复制整个 InfoGen 目录\n"
+    + "=" * 50 + "\n"
+)
+
+_USAGE_LINE = "usage: build_spec.py [-h] [--spec-only]\n"
+
+_HELP = (
+    _USAGE_LINE +
+    "\n"
+    "InfoGen打包工具\n"
+    "\n"
+    "options:\n"
+    "  -h, --help   显示帮助信息并退出\n"
+    "  --spec-only  仅生成spec文件，不执行打包\n"
+)
+
+def create_spec_content():
+    """获取.spec文件内容"""
+    return _SPEC_CONTENT
+
+def compute_build_hash(paths):
+    """计算打包输入文件的内容哈希，用于判断是否需要重新打包"""
+    import hashlib
+    
+    digest = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        with open(path, 'rb') as f:
+            data = f.read()
+        # 先写入相对路径和文件大小作为分隔，避免内容在文件间移动时哈希不变
+        digest.update(path.replace(os.sep, '/').encode('utf-8') + b'\0')
+        digest.update(str(len(data)).encode('ascii') + b'\0')
+        digest.update(data)
+    return digest.hexdigest()
 
 def build_executable(spec_only=False):
     """构建可执行文件"""
     
-    print("=" * 50)
-    print("   InfoGen v3.1 打包工具")  
-    print("=" * 50)
+    sys.stdout.write(_BANNER)
     
     # 检查必要文件
     required_files = ['app.py', 'main_window.py', 'name_generator.py', 'vcf_generator.py']
-    missing_files = [f for f in required_files if not os.path.exists(f)]
+    present_files = {entry.name for entry in os.scandir('.')}
+    missing_files = [f for f in required_files if f not in present_files]
     
     if missing_files:
         print("❌ 错误：缺少必要文件：")
@@ -98,9 +175,30 @@ def build_executable(spec_only=False):
     print(f"📄 创建spec文件：{spec_filename}")
     
     try:
-        with open(spec_filename, 'w', encoding='utf-8') as f:
-            f.write(create_spec_content())
-        print("✅ spec文件创建成功")
+        # 内容未变化时跳过写入，保留文件修改时间
+        try:
+            with open(spec_filename, 'rb') as f:
+                unchanged = f.read() == _SPEC_BYTES
+        except FileNotFoundError:
+            unchanged = False
+        
+        if unchanged:
+            print("✅ spec文件已是最新，无需重新写入")
+        else:
+            # 先写入临时文件再原子替换，避免残留不完整的spec文件
+            temp_filename = spec_filename + '.tmp'
+            try:
+                with open(temp_filename, 'wb') as f:
+                    f.write(_SPEC_BYTES)
+                os.replace(temp_filename, spec_filename)
+            except OSError:
+                # 写入或替换失败时清理临时文件
+                try:
+                    os.remove(temp_filename)
+                except OSError:
+                    pass
+                raise
+            print("✅ spec文件创建成功")
     except Exception as e:
         print(f"❌ spec文件创建失败：{e}")
         return False
@@ -109,37 +207,52 @@ def build_executable(spec_only=False):
         print("🎯 仅生成spec文件模式，跳过打包")
         return True
     
+    # 源文件和spec均未变化时跳过打包；哈希记录放在程序目录之外，不随程序分发
+    exe_path = os.path.join('dist', 'InfoGen', 'InfoGen.exe')
+    hash_path = os.path.join('dist', '.infogen_build_hash')
+    build_inputs = [f for f in required_files + ['umami_analytics.py', 'app_icon.ico'] if f in present_files]
+    build_hash = compute_build_hash(build_inputs + [spec_filename])
+    try:
+        with open(hash_path, 'r', encoding='utf-8') as f:
+            cached_hash = f.read().strip()
+    except OSError:
+        cached_hash = None
+    
+    if cached_hash == build_hash and os.path.exists(exe_path):
+        print("⚡ 源文件未变化，沿用已有打包结果")
+        print(f"📍 文件位置：{exe_path}")
+        return True
+    
     # 执行打包
     print("🔨 开始打包...")
     print("⏳ 这可能需要几分钟时间，请耐心等待...")
     
     try:
-        PyInstaller.__main__.run([
+        # 在独立进程中运行PyInstaller，打包结束后内存随进程释放
+        import subprocess
+        subprocess.run([
+            sys.executable, '-m', 'PyInstaller',
             '--clean',
             '--noconfirm', 
             spec_filename
-        ])
+        ], check=True)
         
         # 检查是否成功生成
-        exe_path = os.path.join('dist', 'InfoGen.exe')
-        if os.path.exists(exe_path):
-            file_size = os.path.getsize(exe_path) / (1024 * 1024)  # MB
-            print(f"✅ 打包成功！")
-            print(f"📍 文件位置：{exe_path}")
-            print(f"📏 文件大小：{file_size:.1f} MB")
-            
-            # 显示使用说明
-            print("\n" + "=" * 50)
-            print("📋 使用说明：")
-            print("1. 可执行文件已生成在 dist 目录下")
-            print("2. InfoGen.exe 可以独立运行，无需Python环境")
-            print("3. 首次运行可能需要较长时间加载")
-            print("4. 建议将exe文件复制到独立目录使用")
-            print("=" * 50)
-            return True
-        else:
+        try:
+            file_size = os.stat(exe_path).st_size / (1024 * 1024)  # MB
+        except FileNotFoundError:
             print("❌ 打包失败：未找到生成的exe文件")
             return False
+        
+        with open(hash_path, 'w', encoding='utf-8') as f:
+            f.write(build_hash)
+        print(f"✅ 打包成功！")
+        print(f"📍 文件位置：{exe_path}")
+        print(f"📏 文件大小：{file_size:.1f} MB")
+        
+        # 显示使用说明
+        sys.stdout.write(_USAGE)
+        return True
             
     except Exception as e:
         print(f"❌ 打包过程中出现错误：{e}")
@@ -157,13 +270,20 @@ def build_executable(spec_only=False):
 
 def main():
     """主函数"""
-    parser = argparse.ArgumentParser(description='InfoGen打包工具')
-    parser.add_argument('--spec-only', action='store_true', 
-                       help='仅生成spec文件，不执行打包')
+    args = sys.argv[1:]
+    
+    if '-h' in args or '--help' in args:
+        sys.stdout.write(_HELP)
+        return
     
-    args = parser.parse_args()
+    # 未知参数（如拼写错误）直接报错退出，避免误触发耗时的打包
+    unknown_args = [arg for arg in args if arg != '--spec-only']
+    if unknown_args:
+        sys.stderr.write(_USAGE_LINE)
+        sys.stderr.write(f"build_spec.py: error: unrecognized arguments: {' '.join(unknown_args)}\n")
+        sys.exit(2)
     
-    success = build_executable(spec_only=args.spec_only)
+    success = build_executable(spec_only='--spec-only' in args)
     
     if success:
         print("\n🎉 操作完成！")
@@ -13,11 +13,8 @@ a = Analysis(
     hiddenimports=[
         'PyQt5.QtCore',
         'PyQt5.QtGui', 
-        'PyQt5.QtWidgets',
-        'name_generator',
-        'vcf_generator',
-        'main_window'
-    ],
+        'PyQt5.QtWidgets'
+    ],  # 应用自身模块由app.py的导入自动追踪，无需重复声明
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -27,7 +24,18 @@ a = Analysis(
         'pandas',
         'scipy',
         'PIL',
-        'tkinter'
+        'tkinter',
+        'PyQt5.QtNetwork',
+        'PyQt5.QtSql',
+        'PyQt5.QtXml',
+        'PyQt5.QtMultimedia',
+        'PyQt5.QtWebEngineCore',
+        'PyQt5.QtBluetooth',
+        'PyQt5.QtPositioning',
+        'PyQt5.QtSensors',
+        'PyQt5.QtQml',
+        'PyQt5.QtQuick',
+        'PyQt5.QtTest'
     ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
@@ -35,22 +43,35 @@ a = Analysis(
     noarchive=False,
 )
 
+# 过滤未使用的Qt动态库，减小体积并加快启动
+unused_qt_libs = (
+    'Qt5Network', 'Qt5Sql', 'Qt5Xml', 'Qt5Multimedia', 'Qt5WebEngine',
+    'Qt5Bluetooth', 'Qt5Positioning', 'Qt5Sensors', 'Qt5Qml', 'Qt5Quick', 'Qt5Test'
+)
+a.binaries = [b for b in a.binaries if not any(lib in b[0] for lib in unused_qt_libs)]
+
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
+# 目录模式：避免每次启动解压到临时目录，Qt核心库不做UPX压缩
+upx_exclude = [
+    'Qt5Core.dll',
+    'Qt5Gui.dll',
+    'Qt5Widgets.dll',
+    'python3*.dll',
+    'vcruntime*.dll'
+]
+
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='InfoGen',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
     upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
+    upx_exclude=upx_exclude,
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -59,3 +80,14 @@ exe = EXE(
     icon='app_icon.ico',
     version_file=None,
 )
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx=True,
+    upx_exclude=upx_exclude,
+    name='InfoGen',
+)
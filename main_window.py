@@ -7,64 +7,548 @@ InfoGen-信息生成器 - PyQt5主界面
 
 import sys
 import os
+import logging
+import time
+from collections import Counter
+from functools import cached_property, lru_cache
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QLabel, QLineEdit, QPushButton, 
-                             QTextEdit, QCheckBox, QSpinBox, QGroupBox, 
-                             QFrame, QSplitter, QMenuBar, QStatusBar,
-                             QMessageBox, QFileDialog, QGridLayout, 
-                             QTabWidget, QComboBox, QProgressBar)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QSettings
-from PyQt5.QtGui import QFont, QIcon, QPalette, QColor, QTextCursor
-from datetime import datetime
+                             QPlainTextEdit, QCheckBox, QSpinBox, QGroupBox, 
+                             QFrame, QStatusBar, QMessageBox, QFileDialog, 
+                             QGridLayout, QTabWidget, QComboBox, QProgressBar, 
+                             QScrollArea)
+from PyQt5.QtCore import (Qt, QObject, QRunnable, QThreadPool, pyqtSignal, 
+                          QTimer, QSettings, QUrl)
+from PyQt5.QtGui import QIcon, QColor, QDesktopServices
 
 from name_generator import NameGenerator, PhoneGenerator
 from vcf_generator import VCFGenerator
 from umami_analytics import UmamiAnalytics
 
+logger = logging.getLogger(__name__)
 
+
+# 常用Qt枚举值预先绑定
+ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+ALIGN_BOTTOM = Qt.AlignmentFlag.AlignBottom
+RICH_TEXT = Qt.TextFormat.RichText
+STYLED_PANEL = QFrame.StyledPanel
+NO_FRAME = QFrame.NoFrame
+NO_WRAP = QPlainTextEdit.NoWrap
+WIDGET_WIDTH_WRAP = QPlainTextEdit.WidgetWidth
+
+# 不超过该数量时直接在界面线程生成，省去线程调度开销
+NAME_INLINE_THRESHOLD = 500
+PHONE_INLINE_THRESHOLD = 1000
+
+# 结果超过该行数时关闭自动换行，省去逐行换行布局
+NOWRAP_LINE_THRESHOLD = 5000
+
+# 导出文本文件时使用的写入缓冲区大小
+EXPORT_BUFFER_SIZE = 1 << 16
+
+# 导出文件的固定表头和结尾模板
+_NAME_EXPORT_HEADER = "InfoGen-信息生成器 - 生成结果\n" + "=" * 30 + "\n\n"
+_NAME_EXPORT_FOOTER_FMT = "\n总计: {} 个姓名"
+_PHONE_EXPORT_HEADER = "手机号生成器 - 生成结果\n" + "=" * 50 + "\n\n"
+_PHONE_EXPORT_FOOTER_FMT = "\n总计: {} 个手机号"
+
+# 下拉框选项到生成器参数的映射（键同时作为下拉框选项）
+_CARRIER_MAP = {
+    "全部": None,
+    "中国移动": "mobile",
+    "中国联通": "unicom",
+    "中国电信": "telecom",
+    "虚拟运营商": "virtual"
+}
+_GENDER_MAP = {"混合": "all", "男性": "boy", "女性": "girl"}
+
+# VCF预览的说明文字
+_VCF_PREVIEW_HEADER = "📋 VCF格式预览（示例联系人）\n" + "=" * 64 + "\n\n"
+_VCF_PREVIEW_FOOTER_FMT = ("\n" + "=" * 64 + "\n"
+                           "💡 说明：以上为VCF标准格式示例\n"
+                           "📱 实际生成时会根据您的设置批量创建\n"
+                           "🎯 当前设置：{}性别，{}运营商")
+
+# 后台任务进度信号的最小发送间隔（约30Hz）
+PROGRESS_MIN_INTERVAL = 1 / 30
+
+# 标签页样式模板，内边距与宽度按DPI缩放后填入
+_TAB_CSS_TEMPLATE = """
+    QTabWidget::pane {{
+        border: 2px solid #ddd;
+        border-radius: 8px;
+        background-color: white;
+    }}
+
+    QTabBar::tab {{
+        background-color: #f5f5f5;
+        border: 1px solid #ddd;
+        padding: {padding_h}px {padding_v}px;
+        margin-right: 2px;
+        border-top-left-radius: 6px;
+        border-top-right-radius: 6px;
+        font-size: 14px;
+        font-weight: bold;
+        min-width: {min_width}px;
+        max-width: {max_width}px;
+        text-align: center;
+    }}
+    QTabBar::tab:selected {{
+        background-color: white;
+        border-bottom: 2px solid white;
+        color: #667eea;
+    }}
+    QTabBar::tab:hover {{
+        background-color: #e8e8e8;
+    }}
+"""
+
+# 分组框样式，各功能面板和结果区域共用
+_GROUPBOX_CSS = """
+    QTabWidget QGroupBox {
+        font-size: 16px;
+        font-weight: bold;
+        color: #333;
+        border: 2px solid #ddd;
+        border-radius: 8px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QTabWidget QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+"""
+
+# 功能设置面板内的字段标签统一加粗
+_CONTROL_LABEL_CSS = """
+    QGroupBox#controlGroup QLabel {
+        font-weight: bold;
+        color: #555;
+    }
+"""
+
+# 结果文本框样式，姓名使用常规字体，手机号和VCF使用等宽字体
+_RESULT_TEXT_CSS = """
+    QPlainTextEdit#nameResult, QPlainTextEdit#phoneResult, QPlainTextEdit#vcfResult {
+        font-family: 'Microsoft YaHei', Arial, sans-serif;
+        font-size: 14px;
+        line-height: 1.5;
+        border: 2px solid #e2e8f0;
+        border-radius: 8px;
+        padding: 15px;
+        background-color: #f8fafc;
+    }
+    QPlainTextEdit#phoneResult, QPlainTextEdit#vcfResult {
+        font-family: 'Consolas', 'Microsoft YaHei', monospace;
+    }
+    QPlainTextEdit#vcfResult {
+        font-size: 12px;
+        line-height: 1.4;
+    }
+    QPlainTextEdit#nameResult:focus, QPlainTextEdit#phoneResult:focus,
+    QPlainTextEdit#vcfResult:focus {
+        border-color: #667eea;
+        background-color: white;
+    }
+"""
+
+_STATS_LABEL_CSS = """
+    QLabel#statsLabel {
+        font-size: 12px;
+        color: #64748b;
+        padding: 5px;
+    }
+"""
+
+_PROGRESS_BAR_CSS = """
+    QTabWidget QProgressBar {
+        border: 2px solid #ddd;
+        border-radius: 5px;
+        text-align: center;
+        font-weight: bold;
+    }
+    QTabWidget QProgressBar::chunk {
+        background-color: #667eea;
+        border-radius: 3px;
+    }
+"""
+
+# 以下控件样式汇总到主窗口样式表中统一解析，限定在标签页内，不影响对话框
+_CHECKBOX_CSS = """
+    QTabWidget QCheckBox {
+        font-size: 14px;
+        color: #555;
+        spacing: 8px;
+    }
+    QTabWidget QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+    }
+    QTabWidget QCheckBox::indicator:unchecked {
+        border: 2px solid #bbb;
+        border-radius: 3px;
+        background-color: white;
+    }
+    QTabWidget QCheckBox::indicator:checked {
+        border: 2px solid #667eea;
+        border-radius: 3px;
+        background-color: #667eea;
+    }
+"""
+
+_SPINBOX_CSS = """
+    QTabWidget QSpinBox {
+        font-size: 14px;
+        padding: 8px;
+        border: 2px solid #ddd;
+        border-radius: 5px;
+        background-color: white;
+    }
+    QTabWidget QSpinBox:focus {
+        border-color: #667eea;
+    }
+"""
+
+_LINEEDIT_CSS = """
+    QTabWidget QLineEdit {
+        font-size: 14px;
+        padding: 8px;
+        border: 2px solid #ddd;
+        border-radius: 5px;
+        background-color: white;
+    }
+    QTabWidget QLineEdit:focus {
+        border-color: #667eea;
+    }
+"""
+
+_COMBO_CSS = """
+    QTabWidget QComboBox {
+        font-size: 14px;
+        padding: 8px;
+        border: 2px solid #ddd;
+        border-radius: 5px;
+        background-color: white;
+    }
+    QTabWidget QComboBox:focus {
+        border-color: #667eea;
+    }
+    QTabWidget QComboBox::drop-down {
+        border: none;
+        width: 20px;
+    }
+    QTabWidget QComboBox::down-arrow {
+        image: none;
+        border-style: solid;
+        border-width: 4px;
+        border-color: transparent transparent #555 transparent;
+    }
+"""
+
+_BUTTON_BASE_CSS = """
+    QPushButton#generateBtn, QPushButton#clearBtn,
+    QPushButton#exportBtn, QPushButton#previewBtn {
+        font-size: 14px;
+        font-weight: bold;
+        padding: 10px 20px;
+        border: none;
+        border-radius: 6px;
+        color: white;
+    }
+"""
+
+_GENERATE_BTN_CSS = """
+    QPushButton#generateBtn {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #667eea, stop:1 #764ba2);
+    }
+    QPushButton#generateBtn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #5a67d8, stop:1 #6b46c1);
+    }
+    QPushButton#generateBtn:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #4c51bf, stop:1 #553c9a);
+    }
+"""
+
+_CLEAR_BTN_CSS = """
+    QPushButton#clearBtn {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #f093fb, stop:1 #f5576c);
+    }
+    QPushButton#clearBtn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #e879f9, stop:1 #ef4444);
+    }
+"""
+
+_EXPORT_BTN_CSS = """
+    QPushButton#exportBtn, QPushButton#previewBtn {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #4facfe, stop:1 #00f2fe);
+    }
+    QPushButton#exportBtn:hover, QPushButton#previewBtn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #3b82f6, stop:1 #06b6d4);
+    }
+"""
+
+_MAIN_WINDOW_CSS = """
+    QMainWindow {
+        background-color: #f1f5f9;
+    }
+    QWidget {
+        font-family: 'Microsoft YaHei', Arial, sans-serif;
+    }
+"""
+
+# 顶部标题区域样式
+_TITLE_FRAME_CSS = """
+    QFrame {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #667eea, stop:1 #764ba2);
+        border-radius: 10px;
+        margin: 5px;
+    }
+"""
+
+_TITLE_MAIN_CSS = """
+    QLabel {
+        color: white;
+        font-size: 24px;
+        font-weight: bold;
+        background: transparent;
+    }
+"""
+
+_TITLE_SUB_CSS = """
+    QLabel {
+        color: #f0f0f0;
+        font-size: 14px;
+        background: transparent;
+        margin-top: 5px;
+    }
+"""
+
+# 关于页面样式
+_ABOUT_TITLE_CSS = """
+    QLabel {
+        font-size: 32px;
+        font-weight: bold;
+        color: #667eea;
+        margin: 0px;
+    }
+"""
+
+_ABOUT_FIRST_HEADING_CSS = """
+    QLabel {
+        font-size: 20px;
+        font-weight: bold;
+        color: #333;
+        margin-top: 10px;
+        margin-bottom: 10px;
+    }
+"""
+
+_ABOUT_FEATURES_CSS = """
+    QLabel {
+        font-size: 14px;
+        color: #555;
+        line-height: 1.8;
+        background-color: #f8f9fa;
+        border-radius: 8px;
+        padding: 20px;
+        border-left: 4px solid #667eea;
+    }
+"""
+
+_ABOUT_HEADING_CSS = """
+    QLabel {
+        font-size: 20px;
+        font-weight: bold;
+        color: #333;
+        margin-top: 20px;
+        margin-bottom: 10px;
+    }
+"""
+
+_ABOUT_DECLARATION_CSS = """
+    QLabel {
+        font-size: 14px;
+        color: #555;
+        line-height: 1.8;
+        background-color: #fff8e1;
+        border-radius: 8px;
+        padding: 20px;
+        border-left: 4px solid #ffc107;
+    }
+"""
+
+_ABOUT_CONTACT_CSS = """
+    QWidget {
+        background-color: #e3f2fd;
+        border-radius: 8px;
+        border-left: 4px solid #2196f3;
+    }
+"""
+
+_ABOUT_LINK_LABEL_CSS = "font-size: 14px; color: #555; background: transparent;"
+
+_ABOUT_COPYRIGHT_CSS = """
+    QLabel {
+        font-size: 12px;
+        color: #adb5bd;
+        text-align: center;
+        margin-top: 30px;
+        padding: 15px;
+        border-top: 1px solid #dee2e6;
+    }
+"""
+
+# 状态栏样式，临时消息期间版权标签切换为高亮样式
+_STATUS_BAR_CSS = """
+    QStatusBar {
+        background-color: #f1f5f9;
+        border: none;
+        padding: 2px 8px;
+    }
+    QStatusBar::item {
+        border: none;
+    }
+"""
+
+_COPYRIGHT_LABEL_CSS = """
+    QLabel {
+        color: #6b7280;
+        font-size: 11px;
+        font-weight: 500;
+        padding: 4px 8px;
+        margin-right: 20px;
+    }
+"""
+
+_COPYRIGHT_LABEL_ACTIVE_CSS = """
+    QLabel {
+        color: #059669;
+        font-size: 11px;
+        font-weight: 500;
+        padding: 4px 8px;
+        margin-right: 20px;
+    }
+"""
+
+_STATUS_STATS_CSS = """
+    QLabel {
+        color: #4b5563;
+        font-size: 11px;
+        font-weight: 400;
+        padding: 4px 8px;
+    }
+"""
+
+GLOBAL_QSS = (_MAIN_WINDOW_CSS + _GROUPBOX_CSS + _CONTROL_LABEL_CSS
+              + _CHECKBOX_CSS + _SPINBOX_CSS + _LINEEDIT_CSS + _COMBO_CSS
+              + _RESULT_TEXT_CSS + _STATS_LABEL_CSS + _PROGRESS_BAR_CSS
+              + _BUTTON_BASE_CSS + _GENERATE_BTN_CSS + _CLEAR_BTN_CSS + _EXPORT_BTN_CSS)
+
+
+def build_vcf_summary_text(result):
+    """根据VCF生成结果构建结果显示文本"""
+    if not result["success"]:
+        return f"❌ 生成失败：{result.get('error', '未知错误')}"
+    
+    basename = os.path.basename
+    file_names = [basename(file_path) for file_path in result["created_files"]]
+    header = f"""✅ VCF文件批量生成完成！
+
+📊 生成统计：
+• 成功创建文件：{result['files_created']} 个
+• 总联系人数：{result['total_contacts']} 个
+• 输出目录：{result['output_directory']}
+
+📁 生成的文件：
+"""
+    return header + "".join([f"• {file_name}\n" for file_name in file_names])
+
+
+def format_number_padded(number):
+    """将序号格式化为至少3位、不足补零的字符串"""
+    return f"{number:03d}"
+
+
+def format_phone_lines(phones, carriers=None):
+    """将手机号格式化为 xxx xxxx xxxx，传入运营商列表时附带运营商标识"""
+    if carriers is not None:
+        return [f"{p[:3]} {p[3:7]} {p[7:]} ({c})" for p, c in zip(phones, carriers)]
+    return [f"{p[:3]} {p[3:7]} {p[7:]}" for p in phones]
+
+
+def describe_phones(generator, phones, show_carrier):
+    """查询每个号码的运营商并生成显示行，返回(运营商列表, 显示行列表)"""
+    carriers = generator.classify_many(phones)
+    return carriers, format_phone_lines(phones, carriers if show_carrier else None)
+
+
+@lru_cache(maxsize=32)
 def get_resource_path(relative_path):
     """获取资源文件的绝对路径，兼容开发环境和打包环境"""
-    try:
-        # PyInstaller打包后的临时目录
-        base_path = getattr(sys, '_MEIPASS', None)
-        if base_path is None:
-            raise AttributeError
-    except AttributeError:
-        # 开发环境
-        base_path = os.path.abspath(".")
+    # PyInstaller打包后的临时目录，开发环境下使用当前目录
+    base_path = getattr(sys, '_MEIPASS', None) or os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
 
-class NameGeneratorThread(QThread):
-    """姓名生成工作线程，避免界面卡顿"""
-    finished = pyqtSignal(list)
+class JobSignals(QObject):
+    """后台任务信号（QRunnable本身不支持信号）"""
+    finished = pyqtSignal(object)
+    progress = pyqtSignal(int)
     error = pyqtSignal(str)
+
+
+class NameJobSignals(JobSignals):
+    """姓名任务信号，完成时附带男女数量和拼接好的结果文本"""
+    finished = pyqtSignal(list, int, int, str)
+
+
+class NameGeneratorJob(QRunnable):
+    """姓名生成后台任务，由全局线程池执行，避免界面卡顿"""
     
     def __init__(self, generator, count, gender):
         super().__init__()
+        self.signals = NameJobSignals()
         self.generator = generator
         self.count = count
         self.gender = gender
     
     def run(self):
         try:
-            names = self.generator.generate_names(self.count, self.gender)
-            self.finished.emit(names)
+            names, boy_count, girl_count = self.generator.generate_names_with_counts(
+                self.count, self.gender
+            )
+            self.signals.finished.emit(names, boy_count, girl_count, "\n".join(names))
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
 
-class PhoneGeneratorThread(QThread):
-    """手机号生成工作线程"""
-    finished = pyqtSignal(list)
-    error = pyqtSignal(str)
+class PhoneJobSignals(JobSignals):
+    """手机号任务信号，完成时附带运营商列表和拼接好的结果文本"""
+    finished = pyqtSignal(list, list, str)
+
+
+class PhoneGeneratorJob(QRunnable):
+    """手机号生成后台任务"""
     
-    def __init__(self, generator, count, carrier, prefix):
+    def __init__(self, generator, count, carrier, prefix, show_carrier=True):
         super().__init__()
+        self.signals = PhoneJobSignals()
         self.generator = generator
         self.count = count
         self.carrier = carrier
         self.prefix = prefix
+        self.show_carrier = show_carrier
     
     def run(self):
         try:
@@ -73,21 +557,20 @@ class PhoneGeneratorThread(QThread):
                 prefix=self.prefix if self.prefix != "随机" else None,
                 carrier=self.carrier if self.carrier != "全部" else None
             )
-            self.finished.emit(phones)
+            carriers, lines = describe_phones(self.generator, phones, self.show_carrier)
+            self.signals.finished.emit(phones, carriers, "\n".join(lines))
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
 
-class VCFGeneratorThread(QThread):
-    """VCF文件生成工作线程"""
-    finished = pyqtSignal(dict)
-    progress = pyqtSignal(int)
-    error = pyqtSignal(str)
+class VCFGeneratorJob(QRunnable):
+    """VCF文件生成后台任务"""
     
     def __init__(self, generator, file_count, contacts_per_file, 
                  output_dir, filename_prefix, gender, carrier,
-                 naming_mode="timestamp", start_number=1, number_format="{:03d}"):
+                 naming_mode="timestamp", start_number=1, number_format=format_number_padded):
         super().__init__()
+        self.signals = JobSignals()
         self.generator = generator
         self.file_count = file_count
         self.contacts_per_file = contacts_per_file
@@ -98,6 +581,19 @@ class VCFGeneratorThread(QThread):
         self.naming_mode = naming_mode
         self.start_number = start_number
         self.number_format = number_format
+        self.last_progress = -1
+        self.last_emit_time = 0.0
+    
+    def report_progress(self, progress):
+        """仅在进度百分比变化且距上次发送超过最小间隔时发送信号，完成时总是发送"""
+        if progress == self.last_progress:
+            return
+        now = time.monotonic()
+        if progress < 100 and now - self.last_emit_time < PROGRESS_MIN_INTERVAL:
+            return
+        self.last_progress = progress
+        self.last_emit_time = now
+        self.signals.progress.emit(progress)
     
     def run(self):
         try:
@@ -108,14 +604,18 @@ class VCFGeneratorThread(QThread):
                 filename_prefix=self.filename_prefix,
                 gender=self.gender,
                 carrier=self.carrier if self.carrier != "全部" else None,
-                progress_callback=self.progress.emit,
+                progress_callback=self.report_progress,
                 naming_mode=self.naming_mode,
                 start_number=self.start_number,
-                number_format=self.number_format
+                number_format=self.number_format,
+                # 输出目录由目录选择对话框选定，必然已存在
+                create_output_dir=False
             )
-            self.finished.emit(result)
+            # 结果文本在后台线程中一次拼接好，界面线程直接显示
+            result["summary_text"] = build_vcf_summary_text(result)
+            self.signals.finished.emit(result)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
 
 class MainWindow(QMainWindow):
@@ -123,9 +623,16 @@ class MainWindow(QMainWindow):
     
     def __init__(self):
         super().__init__()
+        
+        # 缓存DPI缩放比例（96 DPI为标准），供界面尺寸计算复用
+        self.dpi_ratio = QApplication.primaryScreen().logicalDotsPerInch() / 96.0
+        
+        # 加载一次应用图标，窗口图标和关于页面共用
+        icon_path = get_resource_path('app_icon.ico')
+        self.app_icon = QIcon(icon_path) if os.path.exists(icon_path) else None
+        
         self.name_generator = NameGenerator()
         self.phone_generator = PhoneGenerator()
-        self.vcf_generator = VCFGenerator()
         
         # 初始化统计模块
         self.analytics = UmamiAnalytics()
@@ -133,24 +640,32 @@ class MainWindow(QMainWindow):
         # 存储生成的数据
         self.generated_names = []
         self.generated_phones = []
+        self.generated_carriers = []
         
         # 设置配置
         self.settings = QSettings("InfoGen", "InfoGen")
         
+        # 启动时一次性读取保存的窗口状态，避免重复访问配置存储
+        self.saved_geometry = self.settings.value("geometry")
+        self.saved_window_state = self.settings.value("windowState")
+        
         self.init_ui()
         self.restore_window_state()
         
         # 发送应用启动统计事件
         self.analytics.track_app_start()
         
+    @cached_property
+    def vcf_generator(self):
+        """VCF生成器（自带一套姓名/号码数据），首次预览或生成VCF时才创建"""
+        return VCFGenerator()
+    
     def init_ui(self):
         """初始化用户界面"""
         self.setWindowTitle("InfoGen v3.1 - 多功能信息生成器")
         
         # 动态计算最小窗口尺寸，确保界面可用性的同时允许用户灵活调整
-        from PyQt5.QtWidgets import QApplication
-        screen = QApplication.primaryScreen()
-        dpi_ratio = screen.logicalDotsPerInch() / 96.0
+        dpi_ratio = self.dpi_ratio
         
         # 调整为更合理的最小尺寸，确保用户可以缩小窗口
         base_min_width = 580  # 基础最小宽度，足够显示标签栏和控件
@@ -160,18 +675,19 @@ class MainWindow(QMainWindow):
         min_height = max(base_min_height, int(base_min_height * dpi_ratio))
         self.setMinimumSize(min_width, min_height)
         
-        # 调试信息：显示当前的最小尺寸设置
-        print(f"窗口最小尺寸设置: {min_width}x{min_height} (DPI比例: {dpi_ratio:.2f})")
+        # 调试信息：参数延迟格式化，未启用DEBUG级别时不产生开销
+        logger.debug("窗口最小尺寸设置: %dx%d (DPI比例: %.2f)", min_width, min_height, dpi_ratio)
         
         # 仅在没有保存的窗口状态时设置默认几何尺寸
-        saved_geometry = self.settings.value("geometry")
-        if not saved_geometry:
+        if not self.saved_geometry:
             self.setGeometry(100, 100, 1000, 850)
         
         # 设置窗口图标
-        icon_path = get_resource_path('app_icon.ico')
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        if self.app_icon is not None:
+            self.setWindowIcon(self.app_icon)
+        
+        # 先应用全局样式，子控件创建时即可直接使用
+        self.apply_styles()
         
         # 创建中央窗口部件
         central_widget = QWidget()
@@ -191,48 +707,24 @@ class MainWindow(QMainWindow):
         # 创建状态栏
         self.create_status_bar()
         
-        # 应用样式
-        self.apply_styles()
-        
     def create_title_section(self, layout):
         """创建标题区域"""
         title_frame = QFrame()
-        title_frame.setFrameStyle(QFrame.StyledPanel)
-        title_frame.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #667eea, stop:1 #764ba2);
-                border-radius: 10px;
-                margin: 5px;
-            }
-        """)
+        title_frame.setFrameStyle(STYLED_PANEL)
+        title_frame.setStyleSheet(_TITLE_FRAME_CSS)
         
         title_layout = QVBoxLayout(title_frame)
         title_layout.setContentsMargins(20, 15, 20, 15)
         
         # 主标题
         main_title = QLabel("📱 InfoGen 多功能信息生成器")
-        main_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        main_title.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background: transparent;
-            }
-        """)
+        main_title.setAlignment(ALIGN_CENTER)
+        main_title.setStyleSheet(_TITLE_MAIN_CSS)
         
         # 副标题
         subtitle = QLabel("姓名生成 | 手机号生成 | VCF通讯录批量生成")
-        subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        subtitle.setStyleSheet("""
-            QLabel {
-                color: #f0f0f0;
-                font-size: 14px;
-                background: transparent;
-                margin-top: 5px;
-            }
-        """)
+        subtitle.setAlignment(ALIGN_CENTER)
+        subtitle.setStyleSheet(_TITLE_SUB_CSS)
         
         title_layout.addWidget(main_title)
         title_layout.addWidget(subtitle)
@@ -244,9 +736,7 @@ class MainWindow(QMainWindow):
         self.tab_widget = QTabWidget()
         
         # 获取DPI缩放因子，确保在不同显示环境下的适配
-        from PyQt5.QtWidgets import QApplication
-        screen = QApplication.primaryScreen()
-        dpi_ratio = screen.logicalDotsPerInch() / 96.0  # 96 DPI为标准
+        dpi_ratio = self.dpi_ratio
         
         # 根据DPI调整尺寸
         base_padding_h = max(10, int(10 * dpi_ratio))
@@ -254,41 +744,21 @@ class MainWindow(QMainWindow):
         min_tab_width = max(100, int(100 * dpi_ratio))
         max_tab_width = max(180, int(180 * dpi_ratio))
         
-        self.tab_widget.setStyleSheet(f"""
-            QTabWidget::pane {{
-                border: 2px solid #ddd;
-                border-radius: 8px;
-                background-color: white;
-            }}
-
-            QTabBar::tab {{
-                background-color: #f5f5f5;
-                border: 1px solid #ddd;
-                padding: {base_padding_h}px {base_padding_v}px;
-                margin-right: 2px;
-                border-top-left-radius: 6px;
-                border-top-right-radius: 6px;
-                font-size: 14px;
-                font-weight: bold;
-                min-width: {min_tab_width}px;
-                max-width: {max_tab_width}px;
-                text-align: center;
-            }}
-            QTabBar::tab:selected {{
-                background-color: white;
-                border-bottom: 2px solid white;
-                color: #667eea;
-            }}
-            QTabBar::tab:hover {{
-                background-color: #e8e8e8;
-            }}
-        """)
+        self.tab_widget.setStyleSheet(_TAB_CSS_TEMPLATE.format(
+            padding_h=base_padding_h,
+            padding_v=base_padding_v,
+            min_width=min_tab_width,
+            max_width=max_tab_width
+        ))
         
         # 设置标签栏的其他属性以确保显示正常
         self.tab_widget.tabBar().setExpanding(False)  # 禁止标签自动扩展填满空间
         self.tab_widget.tabBar().setUsesScrollButtons(True)  # 启用滚动按钮防止标签过多时溢出
         
-        # 创建各个标签页
+        # 延迟构建的标签页：索引 -> 内容构建方法，构建后移除
+        self.lazy_tab_builders = {}
+        
+        # 创建各个标签页（姓名页为启动时的默认页，直接构建）
         self.create_name_tab()
         self.create_phone_tab()
         self.create_vcf_tab()
@@ -312,48 +782,63 @@ class MainWindow(QMainWindow):
         
         self.tab_widget.addTab(name_tab, "👤 姓名生成")
     
-    def create_phone_tab(self):
-        """创建手机号生成标签页"""
-        phone_tab = QWidget()
-        layout = QVBoxLayout(phone_tab)
-        layout.setSpacing(15)
-        layout.setContentsMargins(20, 20, 20, 20)
+    def add_lazy_tab(self, title, builder, spacing=15, margin=20):
+        """添加标签页占位，内容在首次切换到该页时再由builder构建"""
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        layout.setSpacing(spacing)
+        layout.setContentsMargins(margin, margin, margin, margin)
+        
+        index = self.tab_widget.addTab(tab, title)
+        self.lazy_tab_builders[index] = builder
+        return index
+    
+    def ensure_tab_built(self, index):
+        """首次访问标签页时构建其内容"""
+        builder = self.lazy_tab_builders.pop(index, None)
+        if builder is None:
+            return
+        tab = self.tab_widget.widget(index)
         
+        # 构建期间暂停重绘，所有控件添加完毕后统一布局
+        tab.setUpdatesEnabled(False)
+        builder(tab.layout())
+        tab.setUpdatesEnabled(True)
+    
+    def create_phone_tab(self):
+        """创建手机号生成标签页（内容在首次切换到该页时再构建）"""
+        self.add_lazy_tab("📱 手机号生成", self.build_phone_tab_contents)
+    
+    def build_phone_tab_contents(self, layout):
+        """构建手机号生成标签页内容"""
         # 控制面板
         self.create_phone_control_panel(layout)
         
         # 结果显示区域
         self.create_phone_result_section(layout)
-        
-        self.tab_widget.addTab(phone_tab, "📱 手机号生成")
     
     def create_vcf_tab(self):
-        """创建VCF生成标签页"""
-        vcf_tab = QWidget()
-        layout = QVBoxLayout(vcf_tab)
-        layout.setSpacing(15)
-        layout.setContentsMargins(20, 20, 20, 20)
-        
+        """创建VCF生成标签页（内容在首次切换到该页时再构建）"""
+        self.add_lazy_tab("📁 VCF通讯录", self.build_vcf_tab_contents)
+    
+    def build_vcf_tab_contents(self, layout):
+        """构建VCF生成标签页内容"""
         # 控制面板
         self.create_vcf_control_panel(layout)
         
         # 结果显示区域
         self.create_vcf_result_section(layout)
-        
-        self.tab_widget.addTab(vcf_tab, "📁 VCF通讯录")
 
     def create_about_tab(self):
-        """创建关于标签页"""
-        about_tab = QWidget()
-        layout = QVBoxLayout(about_tab)
-        layout.setSpacing(20)
-        layout.setContentsMargins(40, 40, 40, 40)
-        
+        """创建关于标签页（内容在首次切换到该页时再构建）"""
+        self.add_lazy_tab("ℹ️ 关于", self.build_about_tab_contents, spacing=20, margin=40)
+    
+    def build_about_tab_contents(self, layout):
+        """构建关于标签页内容"""
         # 创建滚动区域
-        from PyQt5.QtWidgets import QScrollArea
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QFrame.NoFrame)
+        scroll.setFrameShape(NO_FRAME)
         
         # 内容容器
         content_widget = QWidget()
@@ -367,25 +852,17 @@ class MainWindow(QMainWindow):
         title_layout.setContentsMargins(0, 0, 0, 0)
         
         # 图标 (如果存在)
-        icon_path = get_resource_path('app_icon.ico')
-        if os.path.exists(icon_path):
+        if self.app_icon is not None:
             icon_label = QLabel()
-            icon_label.setPixmap(QIcon(icon_path).pixmap(64, 64))
-            icon_label.setAlignment(Qt.AlignmentFlag.AlignBottom)
+            icon_label.setPixmap(self.app_icon.pixmap(64, 64))
+            icon_label.setAlignment(ALIGN_BOTTOM)
             title_layout.addWidget(icon_label)
         
         # 标题文本
         title_text_layout = QVBoxLayout()
         main_title = QLabel("InfoGen v3.1")
-        main_title.setAlignment(Qt.AlignmentFlag.AlignBottom)
-        main_title.setStyleSheet("""
-            QLabel {
-                font-size: 32px;
-                font-weight: bold;
-                color: #667eea;
-                margin: 0px;
-            }
-        """)
+        main_title.setAlignment(ALIGN_BOTTOM)
+        main_title.setStyleSheet(_ABOUT_TITLE_CSS)
         
         title_text_layout.addWidget(main_title)
         title_layout.addLayout(title_text_layout)
@@ -395,15 +872,7 @@ class MainWindow(QMainWindow):
         
         # 功能介绍
         feature_title = QLabel("🚀 功能特色")
-        feature_title.setStyleSheet("""
-            QLabel {
-                font-size: 20px;
-                font-weight: bold;
-                color: #333;
-                margin-top: 10px;
-                margin-bottom: 10px;
-            }
-        """)
+        feature_title.setStyleSheet(_ABOUT_FIRST_HEADING_CSS)
         content_layout.addWidget(feature_title)
         
         features_text = QLabel("""
@@ -413,31 +882,13 @@ class MainWindow(QMainWindow):
 • 🎯 数据完整性：301个真实姓氏 + 1000+个常用名字 + 62个运营商号段
 • 💾 多格式导出：支持TXT、CSV等多种格式导出，方便数据使用
         """)
-        features_text.setStyleSheet("""
-            QLabel {
-                font-size: 14px;
-                color: #555;
-                line-height: 1.8;
-                background-color: #f8f9fa;
-                border-radius: 8px;
-                padding: 20px;
-                border-left: 4px solid #667eea;
-            }
-        """)
+        features_text.setStyleSheet(_ABOUT_FEATURES_CSS)
         features_text.setWordWrap(True)
         content_layout.addWidget(features_text)
         
         # 项目声明
         declaration_title = QLabel("📋 项目声明")
-        declaration_title.setStyleSheet("""
-            QLabel {
-                font-size: 20px;
-                font-weight: bold;
-                color: #333;
-                margin-top: 20px;
-                margin-bottom: 10px;
-            }
-        """)
+        declaration_title.setStyleSheet(_ABOUT_HEADING_CSS)
         content_layout.addWidget(declaration_title)
         
         declaration_text = QLabel("""
@@ -448,31 +899,13 @@ class MainWindow(QMainWindow):
 • ⚖️ 合法使用：仅供学习交流和合法用途，请遵守相关法律法规
 • 🚫 禁止滥用：严禁用于诈骗、骚扰等非法活动
         """)
-        declaration_text.setStyleSheet("""
-            QLabel {
-                font-size: 14px;
-                color: #555;
-                line-height: 1.8;
-                background-color: #fff8e1;
-                border-radius: 8px;
-                padding: 20px;
-                border-left: 4px solid #ffc107;
-            }
-        """)
+        declaration_text.setStyleSheet(_ABOUT_DECLARATION_CSS)
         declaration_text.setWordWrap(True)
         content_layout.addWidget(declaration_text)
         
         # 联系信息
         contact_title = QLabel("📞 联系信息")
-        contact_title.setStyleSheet("""
-            QLabel {
-                font-size: 20px;
-                font-weight: bold;
-                color: #333;
-                margin-top: 20px;
-                margin-bottom: 10px;
-            }
-        """)
+        contact_title.setStyleSheet(_ABOUT_HEADING_CSS)
         content_layout.addWidget(contact_title)
         
         # 创建联系信息的垂直布局
@@ -482,35 +915,29 @@ class MainWindow(QMainWindow):
         contact_layout.setContentsMargins(20, 20, 20, 20)
         
         # 设置容器样式
-        contact_container.setStyleSheet("""
-            QWidget {
-                background-color: #e3f2fd;
-                border-radius: 8px;
-                border-left: 4px solid #2196f3;
-            }
-        """)
+        contact_container.setStyleSheet(_ABOUT_CONTACT_CSS)
         
         # 开源地址
         github_label = QLabel('🌟 开源地址：<a href="https://github.com/lemodragon/InfoGen" style="color: #2196f3; text-decoration: none;">https://github.com/lemodragon/InfoGen</a>')
-        github_label.setStyleSheet("font-size: 14px; color: #555; background: transparent;")
+        github_label.setStyleSheet(_ABOUT_LINK_LABEL_CSS)
         github_label.setOpenExternalLinks(False)  # 禁用自动打开，使用自定义处理
-        github_label.setTextFormat(Qt.TextFormat.RichText)
+        github_label.setTextFormat(RICH_TEXT)
         github_label.linkActivated.connect(lambda url: self.on_external_link_clicked(url, "GitHub开源地址"))
         
         # 联系作者
         contact_author_label = QLabel('📧 联系作者：<a href="https://demo.lvdpub.com" style="color: #2196f3; text-decoration: none;">https://demo.lvdpub.com</a>')
-        contact_author_label.setStyleSheet("font-size: 14px; color: #555; background: transparent;")
+        contact_author_label.setStyleSheet(_ABOUT_LINK_LABEL_CSS)
         contact_author_label.setOpenExternalLinks(False)  # 禁用自动打开，使用自定义处理
-        contact_author_label.setTextFormat(Qt.TextFormat.RichText)
+        contact_author_label.setTextFormat(RICH_TEXT)
         contact_author_label.linkActivated.connect(lambda url: self.on_external_link_clicked(url, "联系作者"))
         
         # 问题反馈
         feedback_label = QLabel("💡 问题反馈：欢迎提交Issue或Pull Request")
-        feedback_label.setStyleSheet("font-size: 14px; color: #555; background: transparent;")
+        feedback_label.setStyleSheet(_ABOUT_LINK_LABEL_CSS)
         
         # 技术栈
         tech_label = QLabel("🔧 技术栈：Python + PyQt5 + 现代化UI设计")
-        tech_label.setStyleSheet("font-size: 14px; color: #555; background: transparent;")
+        tech_label.setStyleSheet(_ABOUT_LINK_LABEL_CSS)
         
         # 添加到布局
         contact_layout.addWidget(github_label)
@@ -522,17 +949,8 @@ class MainWindow(QMainWindow):
         
         # 版权信息
         copyright_text = QLabel("© 2025 InfoGen | 基于 PyQt5 开发 | 完全免费开源")
-        copyright_text.setStyleSheet("""
-            QLabel {
-                font-size: 12px;
-                color: #adb5bd;
-                text-align: center;
-                margin-top: 30px;
-                padding: 15px;
-                border-top: 1px solid #dee2e6;
-            }
-        """)
-        copyright_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        copyright_text.setStyleSheet(_ABOUT_COPYRIGHT_CSS)
+        copyright_text.setAlignment(ALIGN_CENTER)
         content_layout.addWidget(copyright_text)
         
         content_layout.addStretch()
@@ -540,8 +958,6 @@ class MainWindow(QMainWindow):
         # 设置滚动区域
         scroll.setWidget(content_widget)
         layout.addWidget(scroll)
-        
-        self.tab_widget.addTab(about_tab, "ℹ️ 关于")
 
     def create_tutorial_tab(self):
         """创建教程标签页"""
@@ -549,7 +965,6 @@ class MainWindow(QMainWindow):
         tutorial_index = self.tab_widget.addTab(tutorial_tab, "📚 教程")
         
         # 设置教程标签页的文字颜色为红色
-        from PyQt5.QtGui import QColor
         self.tab_widget.tabBar().setTabTextColor(tutorial_index, QColor("red"))
         
         # 连接标签页切换事件
@@ -558,29 +973,13 @@ class MainWindow(QMainWindow):
     def create_name_control_panel(self, layout):
         """创建控制面板"""
         control_group = QGroupBox("生成设置")
-        control_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 16px;
-                font-weight: bold;
-                color: #333;
-                border: 2px solid #ddd;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
+        control_group.setObjectName("controlGroup")
         
         control_layout = QGridLayout(control_group)
         control_layout.setSpacing(15)
         
         # 性别选择
         gender_label = QLabel("性别选择:")
-        gender_label.setStyleSheet("font-weight: bold; color: #555;")
         
         gender_layout = QHBoxLayout()
         self.boy_checkbox = QCheckBox("男性")
@@ -588,54 +987,16 @@ class MainWindow(QMainWindow):
         self.boy_checkbox.setChecked(True)
         self.girl_checkbox.setChecked(True)
         
-        # 样式设置
-        checkbox_style = """
-            QCheckBox {
-                font-size: 14px;
-                color: #555;
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-            QCheckBox::indicator:unchecked {
-                border: 2px solid #bbb;
-                border-radius: 3px;
-                background-color: white;
-            }
-            QCheckBox::indicator:checked {
-                border: 2px solid #667eea;
-                border-radius: 3px;
-                background-color: #667eea;
-            }
-        """
-        self.boy_checkbox.setStyleSheet(checkbox_style)
-        self.girl_checkbox.setStyleSheet(checkbox_style)
-        
         gender_layout.addWidget(self.boy_checkbox)
         gender_layout.addWidget(self.girl_checkbox)
         gender_layout.addStretch()
         
         # 生成数量
         count_label = QLabel("生成数量:")
-        count_label.setStyleSheet("font-weight: bold; color: #555;")
         
         self.count_spinbox = QSpinBox()
         self.count_spinbox.setRange(1, 1000)
         self.count_spinbox.setValue(20)
-        self.count_spinbox.setStyleSheet("""
-            QSpinBox {
-                font-size: 14px;
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 5px;
-                background-color: white;
-            }
-            QSpinBox:focus {
-                border-color: #667eea;
-            }
-        """)
         
         # 按钮区域
         button_layout = QHBoxLayout()
@@ -644,53 +1005,9 @@ class MainWindow(QMainWindow):
         self.clear_btn = QPushButton("🗑️ 清空结果")
         self.export_btn = QPushButton("💾 导出文件")
         
-        button_style = """
-            QPushButton {
-                font-size: 14px;
-                font-weight: bold;
-                padding: 10px 20px;
-                border: none;
-                border-radius: 6px;
-                color: white;
-            }
-        """
-        
-        self.generate_btn.setStyleSheet(button_style + """
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #667eea, stop:1 #764ba2);
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #5a67d8, stop:1 #6b46c1);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4c51bf, stop:1 #553c9a);
-            }
-        """)
-        
-        self.clear_btn.setStyleSheet(button_style + """
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #f093fb, stop:1 #f5576c);
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e879f9, stop:1 #ef4444);
-            }
-        """)
-        
-        self.export_btn.setStyleSheet(button_style + """
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4facfe, stop:1 #00f2fe);
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #3b82f6, stop:1 #06b6d4);
-            }
-        """)
+        self.generate_btn.setObjectName("generateBtn")
+        self.clear_btn.setObjectName("clearBtn")
+        self.export_btn.setObjectName("exportBtn")
         
         button_layout.addWidget(self.generate_btn)
         button_layout.addWidget(self.clear_btn)
@@ -714,116 +1031,38 @@ class MainWindow(QMainWindow):
     def create_phone_control_panel(self, layout):
         """创建手机号控制面板"""
         control_group = QGroupBox("手机号生成设置")
-        control_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 16px;
-                font-weight: bold;
-                color: #333;
-                border: 2px solid #ddd;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
+        control_group.setObjectName("controlGroup")
         
         control_layout = QGridLayout(control_group)
         control_layout.setSpacing(15)
         
         # 运营商选择
         carrier_label = QLabel("运营商选择:")
-        carrier_label.setStyleSheet("font-weight: bold; color: #555;")
         
         self.carrier_combo = QComboBox()
-        self.carrier_combo.addItems(["全部", "中国移动", "中国联通", "中国电信", "虚拟运营商"])
+        self.carrier_combo.addItems(list(_CARRIER_MAP))
         self.carrier_combo.setCurrentText("全部")
         
         # 前缀选择
         prefix_label = QLabel("号段前缀:")
-        prefix_label.setStyleSheet("font-weight: bold; color: #555;")
         
         self.prefix_combo = QComboBox()
-        self.prefix_combo.addItem("随机")
-        # 添加所有前缀
-        for prefix in self.phone_generator.prefixes:
-            self.prefix_combo.addItem(prefix)
-        
-        combo_style = """
-            QComboBox {
-                font-size: 14px;
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 5px;
-                background-color: white;
-            }
-            QComboBox:focus {
-                border-color: #667eea;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-style: solid;
-                border-width: 4px;
-                border-color: transparent transparent #555 transparent;
-            }
-        """
-        self.carrier_combo.setStyleSheet(combo_style)
-        self.prefix_combo.setStyleSheet(combo_style)
+        # 一次性添加所有前缀
+        self.prefix_combo.addItems(["随机", *self.phone_generator.prefixes])
+        
         
         # 生成数量
         phone_count_label = QLabel("生成数量:")
-        phone_count_label.setStyleSheet("font-weight: bold; color: #555;")
         
         self.phone_count_spinbox = QSpinBox()
         self.phone_count_spinbox.setRange(1, 10000)
         self.phone_count_spinbox.setValue(50)
-        self.phone_count_spinbox.setStyleSheet("""
-            QSpinBox {
-                font-size: 14px;
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 5px;
-                background-color: white;
-            }
-            QSpinBox:focus {
-                border-color: #667eea;
-            }
-        """)
         
         # 显示选项
         display_label = QLabel("显示选项:")
-        display_label.setStyleSheet("font-weight: bold; color: #555;")
         
         self.show_carrier_checkbox = QCheckBox("显示运营商标识")
         self.show_carrier_checkbox.setChecked(True)  # 默认显示
-        self.show_carrier_checkbox.setStyleSheet("""
-            QCheckBox {
-                font-size: 14px;
-                color: #555;
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-            QCheckBox::indicator:unchecked {
-                border: 2px solid #bbb;
-                border-radius: 3px;
-                background-color: white;
-            }
-            QCheckBox::indicator:checked {
-                border: 2px solid #667eea;
-                border-radius: 3px;
-                background-color: #667eea;
-            }
-        """)
         
         # 按钮区域
         phone_button_layout = QHBoxLayout()
@@ -832,49 +1071,9 @@ class MainWindow(QMainWindow):
         self.clear_phone_btn = QPushButton("🗑️ 清空结果")
         self.export_phone_btn = QPushButton("💾 导出文件")
         
-        button_style = """
-            QPushButton {
-                font-size: 14px;
-                font-weight: bold;
-                padding: 10px 20px;
-                border: none;
-                border-radius: 6px;
-                color: white;
-            }
-        """
-        
-        self.generate_phone_btn.setStyleSheet(button_style + """
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #667eea, stop:1 #764ba2);
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #5a67d8, stop:1 #6b46c1);
-            }
-        """)
-        
-        self.clear_phone_btn.setStyleSheet(button_style + """
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #f093fb, stop:1 #f5576c);
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e879f9, stop:1 #ef4444);
-            }
-        """)
-        
-        self.export_phone_btn.setStyleSheet(button_style + """
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4facfe, stop:1 #00f2fe);
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #3b82f6, stop:1 #06b6d4);
-            }
-        """)
+        self.generate_phone_btn.setObjectName("generateBtn")
+        self.clear_phone_btn.setObjectName("clearBtn")
+        self.export_phone_btn.setObjectName("exportBtn")
         
         phone_button_layout.addWidget(self.generate_phone_btn)
         phone_button_layout.addWidget(self.clear_phone_btn)
@@ -902,29 +1101,14 @@ class MainWindow(QMainWindow):
     def create_vcf_control_panel(self, layout):
         """创建VCF控制面板"""
         control_group = QGroupBox("VCF通讯录批量生成设置")
-        control_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 16px;
-                font-weight: bold;
-                color: #333;
-                border: 2px solid #ddd;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
+        control_group.setObjectName("controlGroup")
+        self.vcf_control_group = control_group
         
         control_layout = QGridLayout(control_group)
         control_layout.setSpacing(15)
         
         # VCF文件数量
         file_count_label = QLabel("VCF文件数量:")
-        file_count_label.setStyleSheet("font-weight: bold; color: #555;")
         
         self.vcf_file_count_spinbox = QSpinBox()
         self.vcf_file_count_spinbox.setRange(1, 1000)
@@ -932,7 +1116,6 @@ class MainWindow(QMainWindow):
         
         # 每文件联系人数量
         contacts_per_file_label = QLabel("每文件联系人数:")
-        contacts_per_file_label.setStyleSheet("font-weight: bold; color: #555;")
         
         self.contacts_per_file_spinbox = QSpinBox()
         self.contacts_per_file_spinbox.setRange(1, 10000)
@@ -940,13 +1123,11 @@ class MainWindow(QMainWindow):
         
         # 文件名前缀
         filename_prefix_label = QLabel("文件名前缀:")
-        filename_prefix_label.setStyleSheet("font-weight: bold; color: #555;")
         
         self.filename_prefix_edit = QLineEdit("通讯录")
         
         # 命名模式选择
         naming_mode_label = QLabel("文件命名模式:")
-        naming_mode_label.setStyleSheet("font-weight: bold; color: #555;")
         
         self.naming_mode_combo = QComboBox()
         self.naming_mode_combo.addItems(["时间戳模式", "自定义序号"])
@@ -954,7 +1135,6 @@ class MainWindow(QMainWindow):
         
         # 起始数字（仅在自定义序号模式下显示）
         self.start_number_label = QLabel("起始数字:")
-        self.start_number_label.setStyleSheet("font-weight: bold; color: #555;")
         
         self.start_number_spinbox = QSpinBox()
         self.start_number_spinbox.setRange(1, 99999)
@@ -962,7 +1142,6 @@ class MainWindow(QMainWindow):
         
         # 数字格式选择（仅在自定义序号模式下显示）
         self.number_format_label = QLabel("数字格式:")
-        self.number_format_label.setStyleSheet("font-weight: bold; color: #555;")
         
         self.number_format_combo = QComboBox()
         self.number_format_combo.addItems(["固定3位数 (001,002...)", "自动位数 (1,2,3...)"])
@@ -976,92 +1155,19 @@ class MainWindow(QMainWindow):
         
         # 联系人性别选择
         vcf_gender_label = QLabel("联系人性别:")
-        vcf_gender_label.setStyleSheet("font-weight: bold; color: #555;")
         
         self.vcf_gender_combo = QComboBox()
-        self.vcf_gender_combo.addItems(["混合", "男性", "女性"])
+        self.vcf_gender_combo.addItems(list(_GENDER_MAP))
         
         # 手机号运营商
         vcf_carrier_label = QLabel("手机号运营商:")
-        vcf_carrier_label.setStyleSheet("font-weight: bold; color: #555;")
         
         self.vcf_carrier_combo = QComboBox()
-        self.vcf_carrier_combo.addItems(["全部", "中国移动", "中国联通", "中国电信", "虚拟运营商"])
-        
-        # 样式设置
-        spinbox_style = """
-            QSpinBox {
-                font-size: 14px;
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 5px;
-                background-color: white;
-            }
-            QSpinBox:focus {
-                border-color: #667eea;
-            }
-        """
-        
-        lineedit_style = """
-            QLineEdit {
-                font-size: 14px;
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 5px;
-                background-color: white;
-            }
-            QLineEdit:focus {
-                border-color: #667eea;
-            }
-        """
-        
-        combo_style = """
-            QComboBox {
-                font-size: 14px;
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 5px;
-                background-color: white;
-            }
-            QComboBox:focus {
-                border-color: #667eea;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-style: solid;
-                border-width: 4px;
-                border-color: transparent transparent #555 transparent;
-            }
-        """
-        
-        self.vcf_file_count_spinbox.setStyleSheet(spinbox_style)
-        self.contacts_per_file_spinbox.setStyleSheet(spinbox_style)
-        self.filename_prefix_edit.setStyleSheet(lineedit_style)
-        self.vcf_gender_combo.setStyleSheet(combo_style)
-        self.vcf_carrier_combo.setStyleSheet(combo_style)
-        self.naming_mode_combo.setStyleSheet(combo_style)
-        self.start_number_spinbox.setStyleSheet(spinbox_style)
-        self.number_format_combo.setStyleSheet(combo_style)
+        self.vcf_carrier_combo.addItems(list(_CARRIER_MAP))
         
         # 进度条
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #ddd;
-                border-radius: 5px;
-                text-align: center;
-                font-weight: bold;
-            }
-            QProgressBar::chunk {
-                background-color: #667eea;
-                border-radius: 3px;
-            }
-        """)
         
         # 按钮区域
         vcf_button_layout = QHBoxLayout()
@@ -1069,38 +1175,8 @@ class MainWindow(QMainWindow):
         self.generate_vcf_btn = QPushButton("📁 批量生成VCF")
         self.preview_vcf_btn = QPushButton("👁️ 预览内容")
         
-        button_style = """
-            QPushButton {
-                font-size: 14px;
-                font-weight: bold;
-                padding: 10px 20px;
-                border: none;
-                border-radius: 6px;
-                color: white;
-            }
-        """
-        
-        self.generate_vcf_btn.setStyleSheet(button_style + """
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #667eea, stop:1 #764ba2);
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #5a67d8, stop:1 #6b46c1);
-            }
-        """)
-        
-        self.preview_vcf_btn.setStyleSheet(button_style + """
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4facfe, stop:1 #00f2fe);
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #3b82f6, stop:1 #06b6d4);
-            }
-        """)
+        self.generate_vcf_btn.setObjectName("generateBtn")
+        self.preview_vcf_btn.setObjectName("previewBtn")
         
         vcf_button_layout.addWidget(self.generate_vcf_btn)
         vcf_button_layout.addWidget(self.preview_vcf_btn)
@@ -1133,272 +1209,69 @@ class MainWindow(QMainWindow):
         
         layout.addWidget(control_group)
 
-    def create_name_result_section(self, layout):
-        """创建姓名结果显示区域"""
-        result_group = QGroupBox("生成结果")
-        result_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 16px;
-                font-weight: bold;
-                color: #333;
-                border: 2px solid #ddd;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
-        
+    def create_result_group(self, layout, title, placeholder, object_name):
+        """创建结果显示分组（文本框+统计标签），返回(文本框, 统计标签)"""
+        result_group = QGroupBox(title)
         result_layout = QVBoxLayout(result_group)
         
-        # 结果显示文本框
-        self.name_result_text = QTextEdit()
-        self.name_result_text.setPlaceholderText("点击'生成姓名'按钮开始生成...")
-        self.name_result_text.setStyleSheet("""
-            QTextEdit {
-                font-family: 'Microsoft YaHei', Arial, sans-serif;
-                font-size: 14px;
-                line-height: 1.5;
-                border: 2px solid #e2e8f0;
-                border-radius: 8px;
-                padding: 15px;
-                background-color: #f8fafc;
-            }
-            QTextEdit:focus {
-                border-color: #667eea;
-                background-color: white;
-            }
-        """)
+        # 结果显示文本框，样式由全局样式表按对象名匹配
+        result_text = QPlainTextEdit()
+        result_text.setReadOnly(True)
+        result_text.setMaximumBlockCount(20000)
+        result_text.setPlaceholderText(placeholder)
+        result_text.setObjectName(object_name)
         
         # 统计信息标签
-        self.name_stats_label = QLabel("准备就绪")
-        self.name_stats_label.setStyleSheet("""
-            QLabel {
-                font-size: 12px;
-                color: #64748b;
-                padding: 5px;
-            }
-        """)
+        stats_label = QLabel("准备就绪")
+        stats_label.setObjectName("statsLabel")
         
-        result_layout.addWidget(self.name_result_text)
-        result_layout.addWidget(self.name_stats_label)
+        result_layout.addWidget(result_text)
+        result_layout.addWidget(stats_label)
         
         layout.addWidget(result_group)
+        return result_text, stats_label
+
+    def create_name_result_section(self, layout):
+        """创建姓名结果显示区域"""
+        self.name_result_text, self.name_stats_label = self.create_result_group(
+            layout, "生成结果", "点击'生成姓名'按钮开始生成...", "nameResult"
+        )
 
     def create_phone_result_section(self, layout):
         """创建手机号结果显示区域"""
-        result_group = QGroupBox("生成结果")
-        result_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 16px;
-                font-weight: bold;
-                color: #333;
-                border: 2px solid #ddd;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
-        
-        result_layout = QVBoxLayout(result_group)
-        
-        # 结果显示文本框
-        self.phone_result_text = QTextEdit()
-        self.phone_result_text.setPlaceholderText("点击'生成手机号'按钮开始生成...")
-        self.phone_result_text.setStyleSheet("""
-            QTextEdit {
-                font-family: 'Consolas', 'Microsoft YaHei', monospace;
-                font-size: 14px;
-                line-height: 1.5;
-                border: 2px solid #e2e8f0;
-                border-radius: 8px;
-                padding: 15px;
-                background-color: #f8fafc;
-            }
-            QTextEdit:focus {
-                border-color: #667eea;
-                background-color: white;
-            }
-        """)
-        
-        # 统计信息标签
-        self.phone_stats_label = QLabel("准备就绪")
-        self.phone_stats_label.setStyleSheet("""
-            QLabel {
-                font-size: 12px;
-                color: #64748b;
-                padding: 5px;
-            }
-        """)
-        
-        result_layout.addWidget(self.phone_result_text)
-        result_layout.addWidget(self.phone_stats_label)
-        
-        layout.addWidget(result_group)
+        self.phone_result_text, self.phone_stats_label = self.create_result_group(
+            layout, "生成结果", "点击'生成手机号'按钮开始生成...", "phoneResult"
+        )
 
     def create_vcf_result_section(self, layout):
         """创建VCF结果显示区域"""
-        result_group = QGroupBox("生成结果与预览")
-        result_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 16px;
-                font-weight: bold;
-                color: #333;
-                border: 2px solid #ddd;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
-        
-        result_layout = QVBoxLayout(result_group)
-        
-        # 结果显示文本框
-        self.vcf_result_text = QTextEdit()
-        self.vcf_result_text.setPlaceholderText("点击'预览内容'查看VCF格式，或点击'批量生成VCF'开始生成文件...")
-        self.vcf_result_text.setStyleSheet("""
-            QTextEdit {
-                font-family: 'Consolas', 'Microsoft YaHei', monospace;
-                font-size: 12px;
-                line-height: 1.4;
-                border: 2px solid #e2e8f0;
-                border-radius: 8px;
-                padding: 15px;
-                background-color: #f8fafc;
-            }
-            QTextEdit:focus {
-                border-color: #667eea;
-                background-color: white;
-            }
-        """)
-        
-        # 统计信息标签
-        self.vcf_stats_label = QLabel("准备就绪")
-        self.vcf_stats_label.setStyleSheet("""
-            QLabel {
-                font-size: 12px;
-                color: #64748b;
-                padding: 5px;
-            }
-        """)
-        
-        result_layout.addWidget(self.vcf_result_text)
-        result_layout.addWidget(self.vcf_stats_label)
-        
-        layout.addWidget(result_group)
+        self.vcf_result_text, self.vcf_stats_label = self.create_result_group(
+            layout, "生成结果与预览",
+            "点击'预览内容'查看VCF格式，或点击'批量生成VCF'开始生成文件...", "vcfResult"
+        )
         
     def create_result_section(self, layout):
         """创建结果显示区域"""
-        result_group = QGroupBox("生成结果")
-        result_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 16px;
-                font-weight: bold;
-                color: #333;
-                border: 2px solid #ddd;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
-        
-        result_layout = QVBoxLayout(result_group)
-        
-        # 结果显示文本框
-        self.result_text = QTextEdit()
-        self.result_text.setPlaceholderText("点击'生成姓名'按钮开始生成...")
-        self.result_text.setStyleSheet("""
-            QTextEdit {
-                font-family: 'Microsoft YaHei', Arial, sans-serif;
-                font-size: 14px;
-                line-height: 1.5;
-                border: 2px solid #e2e8f0;
-                border-radius: 8px;
-                padding: 15px;
-                background-color: #f8fafc;
-            }
-            QTextEdit:focus {
-                border-color: #667eea;
-                background-color: white;
-            }
-        """)
-        
-        # 统计信息标签
-        self.stats_label = QLabel("准备就绪")
-        self.stats_label.setStyleSheet("""
-            QLabel {
-                font-size: 12px;
-                color: #64748b;
-                padding: 5px;
-            }
-        """)
-        
-        result_layout.addWidget(self.result_text)
-        result_layout.addWidget(self.stats_label)
-        
-        layout.addWidget(result_group)
+        self.result_text, self.stats_label = self.create_result_group(
+            layout, "生成结果", "点击'生成姓名'按钮开始生成...", "nameResult"
+        )
         
     def create_status_bar(self):
         """创建状态栏"""
         self.status_bar = QStatusBar()
         
         # 设置状态栏样式
-        self.status_bar.setStyleSheet("""
-            QStatusBar {
-                background-color: #f1f5f9;
-                border: none;
-                padding: 2px 8px;
-            }
-            QStatusBar::item {
-                border: none;
-            }
-        """)
+        self.status_bar.setStyleSheet(_STATUS_BAR_CSS)
         
         # 创建版权信息标签
         copyright_label = QLabel("© 2025 InfoGen | 基于 PyQt5 开发 | 完全免费开源")
-        copyright_label.setStyleSheet("""
-            QLabel {
-                color: #6b7280;
-                font-size: 11px;
-                font-weight: 500;
-                padding: 4px 8px;
-                margin-right: 20px;
-            }
-        """)
+        copyright_label.setStyleSheet(_COPYRIGHT_LABEL_CSS)
         
-        # 添加数据库统计信息
-        name_stats = self.name_generator.get_statistics()
-        phone_stats = self.phone_generator.get_statistics()
-        stats_text = f"📊 姓名库：{name_stats['姓氏数量']}个姓氏，{name_stats['男性双字名']+name_stats['男性单字名']}个男性名，{name_stats['女性双字名']+name_stats['女性单字名']}个女性名 | 号段库：{phone_stats['总号段数']}个号段"
-        
-        stats_label = QLabel(stats_text)
-        stats_label.setStyleSheet("""
-            QLabel {
-                color: #4b5563;
-                font-size: 11px;
-                font-weight: 400;
-                padding: 4px 8px;
-            }
-        """)
+        # 数据库统计信息在窗口显示后的下一轮事件循环中再填充
+        stats_label = QLabel("📊 统计加载中...")
+        stats_label.setStyleSheet(_STATUS_STATS_CSS)
+        self.status_stats_label = stats_label
+        QTimer.singleShot(0, self.load_status_stats)
         
         # 添加到状态栏
         self.status_bar.addWidget(copyright_label)
@@ -1406,49 +1279,48 @@ class MainWindow(QMainWindow):
         
         # 保存版权标签引用，用于临时消息显示
         self.copyright_label = copyright_label
+        self.status_original_text = copyright_label.text()
+        
+        # 临时消息复用同一个单次定时器，新消息会重新计时
+        self.status_timer = QTimer(self)
+        self.status_timer.setSingleShot(True)
+        self.status_timer.timeout.connect(self.restore_copyright_label)
         
         self.setStatusBar(self.status_bar)
     
+    def load_status_stats(self):
+        """填充状态栏中的数据库统计信息"""
+        name_stats = self.name_generator.get_statistics()
+        phone_stats = self.phone_generator.get_statistics()
+        stats_text = f"📊 姓名库：{name_stats['姓氏数量']}个姓氏，{name_stats['男性双字名']+name_stats['男性单字名']}个男性名，{name_stats['女性双字名']+name_stats['女性单字名']}个女性名 | 号段库：{phone_stats['总号段数']}个号段"
+        self.status_stats_label.setText(stats_text)
+    
     def show_temp_message(self, message, duration=3000):
         """显示临时消息"""
-        original_text = self.copyright_label.text()
+        # 上一条临时消息仍在显示时沿用已保存的原始文本和高亮样式
+        if not self.status_timer.isActive():
+            self.status_original_text = self.copyright_label.text()
+            self.copyright_label.setStyleSheet(_COPYRIGHT_LABEL_ACTIVE_CSS)
         self.copyright_label.setText(message)
-        self.copyright_label.setStyleSheet("""
-            QLabel {
-                color: #059669;
-                font-size: 11px;
-                font-weight: 500;
-                padding: 4px 8px;
-                margin-right: 20px;
-            }
-        """)
         
-        # 设置定时器恢复原始文本和样式
-        QTimer.singleShot(duration, lambda: self.restore_copyright_label(original_text))
+        # 重新启动定时器，到时恢复原始文本和样式
+        self.status_timer.start(duration)
     
-    def restore_copyright_label(self, original_text):
+    def restore_copyright_label(self):
         """恢复版权标签的原始样式"""
-        self.copyright_label.setText(original_text)
-        self.copyright_label.setStyleSheet("""
-            QLabel {
-                color: #6b7280;
-                font-size: 11px;
-                font-weight: 500;
-                padding: 4px 8px;
-                margin-right: 20px;
-            }
-        """)
+        self.copyright_label.setText(self.status_original_text)
+        self.copyright_label.setStyleSheet(_COPYRIGHT_LABEL_CSS)
+        
+    def set_result_text(self, text_edit, text, line_count=0):
+        """批量填充结果文本框，填充期间暂停重绘"""
+        text_edit.setUpdatesEnabled(False)
+        text_edit.setLineWrapMode(NO_WRAP if line_count > NOWRAP_LINE_THRESHOLD else WIDGET_WIDTH_WRAP)
+        text_edit.setPlainText(text)
+        text_edit.setUpdatesEnabled(True)
         
     def apply_styles(self):
         """应用全局样式"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f1f5f9;
-            }
-            QWidget {
-                font-family: 'Microsoft YaHei', Arial, sans-serif;
-            }
-        """)
+        self.setStyleSheet(GLOBAL_QSS)
         
     def generate_names(self):
         """生成姓名"""
@@ -1467,29 +1339,37 @@ class MainWindow(QMainWindow):
             
         count = self.count_spinbox.value()
         
+        # 小批量生成耗时远低于一帧，直接在界面线程完成
+        if count <= NAME_INLINE_THRESHOLD:
+            try:
+                names, boy_count, girl_count = self.name_generator.generate_names_with_counts(
+                    count, gender
+                )
+            except Exception as e:
+                self.on_generation_error(str(e))
+                return
+            self.on_names_generated(names, boy_count, girl_count, "\n".join(names))
+            return
+        
         # 禁用生成按钮，防止重复点击
         self.generate_btn.setEnabled(False)
         self.generate_btn.setText("⏳ 生成中...")
         self.show_temp_message("正在生成姓名...")
         
-        # 创建并启动工作线程
-        self.name_worker_thread = NameGeneratorThread(self.name_generator, count, gender)
-        self.name_worker_thread.finished.connect(self.on_names_generated)
-        self.name_worker_thread.error.connect(self.on_generation_error)
-        self.name_worker_thread.start()
+        # 创建后台任务并提交到线程池
+        self.name_worker = NameGeneratorJob(self.name_generator, count, gender)
+        self.name_worker.signals.finished.connect(self.on_names_generated)
+        self.name_worker.signals.error.connect(self.on_generation_error)
+        QThreadPool.globalInstance().start(self.name_worker)
         
-    def on_names_generated(self, names):
-        """姓名生成完成回调"""
+    def on_names_generated(self, names, boy_count, girl_count, result_text):
+        """姓名生成完成回调（男女数量和结果文本在生成时一并得到）"""
         self.generated_names = names
         
         # 显示结果
-        result_text = "\n".join(names)
-        self.name_result_text.setText(result_text)
+        self.set_result_text(self.name_result_text, result_text, len(names))
         
         # 更新统计信息
-        boy_count = sum(1 for name in names if self.is_likely_boy_name(name))
-        girl_count = len(names) - boy_count
-        
         stats_text = f"已生成 {len(names)} 个姓名 | 男性: {boy_count} 个 | 女性: {girl_count} 个"
         self.name_stats_label.setText(stats_text)
         
@@ -1505,19 +1385,6 @@ class MainWindow(QMainWindow):
         self.generate_btn.setText("🎲 生成姓名")
         self.show_temp_message("❌ 生成失败")
         
-    def is_likely_boy_name(self, name):
-        """简单判断是否为男性姓名（基于名字部分）"""
-        if len(name) <= 1:
-            return True
-            
-        name_part = name[1:]  # 去掉姓氏
-        
-        # 检查是否在男性名字数据中
-        for boy_name in self.name_generator.boy2 + self.name_generator.boy1:
-            if name_part == boy_name:
-                return True
-        return False
-        
     def clear_results(self):
         """清空姓名结果"""
         self.name_result_text.clear()
@@ -1538,12 +1405,10 @@ class MainWindow(QMainWindow):
         
         if file_path:
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write("InfoGen-信息生成器 - 生成结果\n")
-                    f.write("=" * 30 + "\n\n")
-                    for i, name in enumerate(self.generated_names, 1):
-                        f.write(f"{i:3d}. {name}\n")
-                    f.write(f"\n总计: {len(self.generated_names)} 个姓名")
+                with open(file_path, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+                    f.write(_NAME_EXPORT_HEADER)
+                    f.writelines(f"{i:3d}. {name}\n" for i, name in enumerate(self.generated_names, 1))
+                    f.write(_NAME_EXPORT_FOOTER_FMT.format(len(self.generated_names)))
                     
                 QMessageBox.information(self, "导出成功", f"姓名列表已保存到：\n{file_path}")
                 self.show_temp_message("💾 导出成功")
@@ -1559,57 +1424,50 @@ class MainWindow(QMainWindow):
         carrier_text = self.carrier_combo.currentText()
         prefix_text = self.prefix_combo.currentText()
         
-        # 映射运营商选择
-        carrier_map = {
-            "全部": None,
-            "中国移动": "mobile",
-            "中国联通": "unicom", 
-            "中国电信": "telecom",
-            "虚拟运营商": "virtual"
-        }
-        carrier = carrier_map.get(carrier_text)
+        carrier = _CARRIER_MAP.get(carrier_text)
+        
+        # 小批量生成直接在界面线程完成
+        if count <= PHONE_INLINE_THRESHOLD:
+            try:
+                phones = self.phone_generator.generate_phone_numbers(
+                    count,
+                    prefix=prefix_text if prefix_text != "随机" else None,
+                    carrier=carrier
+                )
+                carriers, lines = describe_phones(
+                    self.phone_generator, phones, self.show_carrier_checkbox.isChecked()
+                )
+            except Exception as e:
+                self.on_phone_generation_error(str(e))
+                return
+            self.on_phones_generated(phones, carriers, "\n".join(lines))
+            return
         
         # 禁用生成按钮
         self.generate_phone_btn.setEnabled(False)
         self.generate_phone_btn.setText("⏳ 生成中...")
         self.show_temp_message("正在生成手机号...")
         
-        # 创建并启动工作线程
-        self.phone_worker_thread = PhoneGeneratorThread(
-            self.phone_generator, count, carrier, prefix_text
+        # 创建后台任务并提交到线程池
+        self.phone_worker = PhoneGeneratorJob(
+            self.phone_generator, count, carrier, prefix_text,
+            self.show_carrier_checkbox.isChecked()
         )
-        self.phone_worker_thread.finished.connect(self.on_phones_generated)
-        self.phone_worker_thread.error.connect(self.on_phone_generation_error)
-        self.phone_worker_thread.start()
+        self.phone_worker.signals.finished.connect(self.on_phones_generated)
+        self.phone_worker.signals.error.connect(self.on_phone_generation_error)
+        QThreadPool.globalInstance().start(self.phone_worker)
     
-    def on_phones_generated(self, phones):
-        """手机号生成完成回调"""
+    def on_phones_generated(self, phones, carriers, result_text):
+        """手机号生成完成回调（运营商和结果文本已在生成时一并算好）"""
         self.generated_phones = phones
-        
-        # 格式化显示结果
-        formatted_phones = []
-        carrier_stats = {}
-        
-        for phone in phones:
-            # 格式化为 xxx xxxx xxxx
-            formatted = f"{phone[:3]} {phone[3:7]} {phone[7:]}"
-            carrier = self.phone_generator.get_carrier_name(phone)
-            
-            # 根据复选框状态决定是否显示运营商标识
-            if self.show_carrier_checkbox.isChecked():
-                formatted_phones.append(f"{formatted} ({carrier})")
-            else:
-                formatted_phones.append(formatted)
-                
-            carrier_stats[carrier] = carrier_stats.get(carrier, 0) + 1
+        self.generated_carriers = carriers
         
         # 显示结果
-        result_text = "\n".join(formatted_phones)
-        self.phone_result_text.setText(result_text)
+        self.set_result_text(self.phone_result_text, result_text, len(phones))
         
         # 统计信息
         stats_parts = [f"已生成 {len(phones)} 个手机号"]
-        for carrier, count in carrier_stats.items():
+        for carrier, count in Counter(carriers).items():
             stats_parts.append(f"{carrier}: {count}个")
         
         stats_text = " | ".join(stats_parts)
@@ -1631,6 +1489,7 @@ class MainWindow(QMainWindow):
         """清空手机号结果"""
         self.phone_result_text.clear()
         self.generated_phones = []
+        self.generated_carriers = []
         self.phone_stats_label.setText("准备就绪")
         self.show_temp_message("🗑️ 已清空手机号结果", 2000)
     
@@ -1646,20 +1505,16 @@ class MainWindow(QMainWindow):
         
         if file_path:
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write("手机号生成器 - 生成结果\n")
-                    f.write("=" * 50 + "\n\n")
+                with open(file_path, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+                    f.write(_PHONE_EXPORT_HEADER)
                     
-                    for phone in self.generated_phones:
-                        formatted = f"{phone[:3]} {phone[3:7]} {phone[7:]}"
-                        carrier = self.phone_generator.get_carrier_name(phone)
-                        # 根据复选框状态决定是否包含运营商标识
-                        if self.show_carrier_checkbox.isChecked():
-                            f.write(f"{formatted} ({carrier})\n")
-                        else:
-                            f.write(f"{formatted}\n")
+                    # 根据复选框状态决定是否包含运营商标识，整体拼接后一次写入
+                    show_carrier = self.show_carrier_checkbox.isChecked()
+                    lines = format_phone_lines(self.generated_phones,
+                                               self.generated_carriers if show_carrier else None)
+                    f.write("\n".join(lines) + "\n")
                     
-                    f.write(f"\n总计: {len(self.generated_phones)} 个手机号")
+                    f.write(_PHONE_EXPORT_FOOTER_FMT.format(len(self.generated_phones)))
                 
                 QMessageBox.information(self, "成功", f"文件已保存至：{file_path}")
                 self.show_temp_message("💾 手机号导出成功")
@@ -1672,11 +1527,15 @@ class MainWindow(QMainWindow):
         """命名模式改变时的处理"""
         is_custom_mode = (mode_text == "自定义序号")
         
-        # 显示/隐藏自定义序号相关控件
+        # 显示/隐藏自定义序号相关控件，期间暂停重绘，完成后统一布局一次
+        control_group = self.vcf_control_group
+        control_group.setUpdatesEnabled(False)
         self.start_number_label.setVisible(is_custom_mode)
         self.start_number_spinbox.setVisible(is_custom_mode)
         self.number_format_label.setVisible(is_custom_mode)
         self.number_format_combo.setVisible(is_custom_mode)
+        control_group.layout().activate()
+        control_group.setUpdatesEnabled(True)
         
         # 更新界面提示
         if is_custom_mode:
@@ -1693,19 +1552,10 @@ class MainWindow(QMainWindow):
         gender_text = self.vcf_gender_combo.currentText()
         carrier_text = self.vcf_carrier_combo.currentText()
         
-        # 映射性别选择
-        gender_map = {"混合": "all", "男性": "boy", "女性": "girl"}
-        gender = gender_map.get(gender_text, "all")
+        # 映射性别和运营商选择
+        gender = _GENDER_MAP.get(gender_text, "all")
         
-        # 映射运营商选择
-        carrier_map = {
-            "全部": None,
-            "中国移动": "mobile", 
-            "中国联通": "unicom",
-            "中国电信": "telecom",
-            "虚拟运营商": "virtual"
-        }
-        carrier = carrier_map.get(carrier_text)
+        carrier = _CARRIER_MAP.get(carrier_text)
         
         # 获取命名模式相关参数
         naming_mode_text = self.naming_mode_combo.currentText()
@@ -1714,7 +1564,7 @@ class MainWindow(QMainWindow):
         
         # 获取数字格式
         format_text = self.number_format_combo.currentText()
-        number_format = "{:03d}" if "固定3位数" in format_text else "{:d}"
+        number_format = format_number_padded if "固定3位数" in format_text else str
         
         # 选择输出目录
         output_dir = QFileDialog.getExistingDirectory(self, "选择VCF文件保存目录")
@@ -1728,41 +1578,24 @@ class MainWindow(QMainWindow):
         self.generate_vcf_btn.setText("⏳ 生成中...")
         self.show_temp_message("正在批量生成VCF文件...")
         
-        # 创建并启动工作线程
-        self.vcf_worker_thread = VCFGeneratorThread(
+        # 创建后台任务并提交到线程池
+        self.vcf_worker = VCFGeneratorJob(
             self.vcf_generator, file_count, contacts_per_file,
             output_dir, filename_prefix, gender, carrier,
             naming_mode, start_number, number_format
         )
-        self.vcf_worker_thread.finished.connect(self.on_vcf_generated)
-        self.vcf_worker_thread.progress.connect(self.on_vcf_progress)
-        self.vcf_worker_thread.error.connect(self.on_vcf_generation_error)
-        self.vcf_worker_thread.start()
+        self.vcf_worker.signals.finished.connect(self.on_vcf_generated)
+        self.vcf_worker.signals.progress.connect(self.on_vcf_progress)
+        self.vcf_worker.signals.error.connect(self.on_vcf_generation_error)
+        QThreadPool.globalInstance().start(self.vcf_worker)
     
     def on_vcf_generated(self, result):
         """VCF生成完成回调"""
         # 隐藏进度条
         self.progress_bar.setVisible(False)
         
-        # 显示结果
-        if result["success"]:
-            result_text = f"""✅ VCF文件批量生成完成！
-
-📊 生成统计：
-• 成功创建文件：{result['files_created']} 个
-• 总联系人数：{result['total_contacts']} 个
-• 输出目录：{result['output_directory']}
-
-📁 生成的文件：
-"""
-            for file_path in result["created_files"]:
-                file_name = file_path.split("/")[-1] if "/" in file_path else file_path.split("\\")[-1]
-                result_text += f"• {file_name}\n"
-                
-        else:
-            result_text = f"❌ 生成失败：{result.get('error', '未知错误')}"
-        
-        self.vcf_result_text.setText(result_text)
+        # 显示结果（结果文本已在后台任务中生成）
+        self.set_result_text(self.vcf_result_text, result["summary_text"], len(result.get("created_files", ())))
         
         # 更新统计
         if result["success"]:
@@ -1797,17 +1630,9 @@ class MainWindow(QMainWindow):
         carrier_text = self.vcf_carrier_combo.currentText()
         
         # 映射选择
-        gender_map = {"混合": "all", "男性": "boy", "女性": "girl"}
-        gender = gender_map.get(gender_text, "all")
-        
-        carrier_map = {
-            "全部": None,
-            "中国移动": "mobile",
-            "中国联通": "unicom", 
-            "中国电信": "telecom",
-            "虚拟运营商": "virtual"
-        }
-        carrier = carrier_map.get(carrier_text)
+        gender = _GENDER_MAP.get(gender_text, "all")
+        
+        carrier = _CARRIER_MAP.get(carrier_text)
         
         # 生成预览内容
         try:
@@ -1816,18 +1641,9 @@ class MainWindow(QMainWindow):
             )
             
             # 添加说明文字
-            header = """📋 VCF格式预览（示例联系人）
-================================================================
-
-"""
-            footer = f"""
-================================================================
-💡 说明：以上为VCF标准格式示例
-📱 实际生成时会根据您的设置批量创建
-🎯 当前设置：{gender_text}性别，{carrier_text}运营商"""
-            
-            full_content = header + preview_content + footer
-            self.vcf_result_text.setText(full_content)
+            full_content = "".join((_VCF_PREVIEW_HEADER, preview_content,
+                                    _VCF_PREVIEW_FOOTER_FMT.format(gender_text, carrier_text)))
+            self.set_result_text(self.vcf_result_text, full_content, full_content.count("\n") + 1)
             
             self.vcf_stats_label.setText("VCF格式预览已生成")
             self.show_temp_message("📋 VCF预览完成", 2000)
@@ -1839,46 +1655,49 @@ class MainWindow(QMainWindow):
         """恢复窗口状态"""
         try:
             # 恢复窗口几何（位置和大小）
-            geometry = self.settings.value("geometry")
+            geometry = self.saved_geometry
             if geometry:
                 success = self.restoreGeometry(geometry)
                 if success:
-                    print("成功恢复窗口尺寸和位置")
+                    logger.debug("成功恢复窗口尺寸和位置")
                 else:
-                    print("窗口几何数据无效，使用默认设置")
+                    logger.debug("窗口几何数据无效，使用默认设置")
                     # 如果恢复失败，设置默认几何
                     self.setGeometry(100, 100, 1200, 850)
             
             # 恢复窗口状态（最大化、最小化等）
-            window_state = self.settings.value("windowState")
+            window_state = self.saved_window_state
             if window_state:
                 success = self.restoreState(window_state)
                 if success:
-                    print("成功恢复窗口状态")
+                    logger.debug("成功恢复窗口状态")
                 else:
-                    print("窗口状态数据无效")
+                    logger.debug("窗口状态数据无效")
         except Exception as e:
-            print(f"恢复窗口状态失败: {e}")
+            logger.warning("恢复窗口状态失败: %s", e)
             # 发生异常时确保有默认窗口大小
             self.setGeometry(100, 100, 1200, 850)
     
     def save_window_state(self):
         """保存窗口状态"""
         try:
-            # 保存窗口几何（位置和大小）
+            # 保存窗口几何（位置和大小），与启动时读取的值相同则跳过写入
             geometry = self.saveGeometry()
-            self.settings.setValue("geometry", geometry)
+            if geometry != self.saved_geometry:
+                self.settings.setValue("geometry", geometry)
+                self.saved_geometry = geometry
             
             # 保存窗口状态（最大化、最小化等）
             window_state = self.saveState()
-            self.settings.setValue("windowState", window_state)
+            if window_state != self.saved_window_state:
+                self.settings.setValue("windowState", window_state)
+                self.saved_window_state = window_state
             
-            # 强制同步设置到磁盘
-            self.settings.sync()
-            print("窗口状态已保存")
+            # 不强制sync()，QSettings在析构时及事件循环空闲时自动写回磁盘
+            logger.debug("窗口状态已保存")
             
         except Exception as e:
-            print(f"保存窗口状态失败: {e}")
+            logger.warning("保存窗口状态失败: %s", e)
     
     def closeEvent(self, event):
         """窗口关闭事件"""
@@ -1894,6 +1713,9 @@ class MainWindow(QMainWindow):
         if 0 <= index < len(tab_names):
             tab_name = tab_names[index]
             
+            # 首次访问时构建标签页内容
+            self.ensure_tab_built(index)
+            
             # 如果切换到关于页面，发送关于页面访问统计
             if tab_name == "about":
                 self.analytics.track_about_page_view()
@@ -1903,8 +1725,6 @@ class MainWindow(QMainWindow):
                 self.analytics.track_external_link_click("https://mp.weixin.qq.com/s/FIEQiHgMosMKi24EUI_DRw", "教程")
                 # 打开外部链接
                 try:
-                    from PyQt5.QtGui import QDesktopServices
-                    from PyQt5.QtCore import QUrl
                     QDesktopServices.openUrl(QUrl("https://mp.weixin.qq.com/s/FIEQiHgMosMKi24EUI_DRw"))
                 except Exception as e:
                     print(f"打开教程链接失败: {e}")
@@ -1934,8 +1754,6 @@ class MainWindow(QMainWindow):
         
         # 打开外部链接
         try:
-            from PyQt5.QtGui import QDesktopServices
-            from PyQt5.QtCore import QUrl
             QDesktopServices.openUrl(QUrl(url))
         except Exception as e:
             print(f"打开外部链接失败: {e}")
@@ -1943,6 +1761,9 @@ class MainWindow(QMainWindow):
 
 def main():
     """主程序入口"""
+    # 调试信息默认不输出，避免启动和关闭时的同步控制台写入
+    logging.basicConfig(level=logging.INFO)
+    
     app = QApplication(sys.argv)
     
     # 设置应用程序信息
@@ -6,6 +6,10 @@ InfoGen-信息生成器 - 核心逻辑模块
 """
 
 import random
+from itertools import accumulate
+
+# 生成双字名的概率，其余为单字名
+DOUBLE_NAME_PROBABILITY = 0.7
 
 
 class PhoneGenerator:
@@ -13,6 +17,9 @@ class PhoneGenerator:
     
     def __init__(self):
         """初始化手机号码前缀数据库"""
+        # 每个实例独立的随机数生成器（MT19937）；测试数据无需密码学安全的随机源
+        self.rng = random.Random()
+        
         # 中国大陆手机号码前缀（根据用户提供的最新号段）
         self.prefixes = [
             # 中国移动号段
@@ -60,6 +67,39 @@ class PhoneGenerator:
         self.virtual_prefixes = [
             "170", "171", "162"
         ]
+        
+        # 号段集合，用于前缀校验的哈希查找（列表保留供外部使用）
+        self.prefix_set = frozenset(self.prefixes)
+        
+        # 各号段对应的后缀位数（绝大多数为8位，"1440"为7位）
+        self.suffix_length_by_prefix = {p: 11 - len(p) for p in self.prefixes}
+        
+        # 运营商 -> 号段元组，按运营商选择前缀时直接查表（其他取值使用全部号段）
+        self.prefix_pools = {
+            "mobile": tuple(self.mobile_prefixes),
+            "unicom": tuple(self.unicom_prefixes),
+            "telecom": tuple(self.telecom_prefixes),
+            "virtual": tuple(self.virtual_prefixes),
+        }
+        self.all_prefix_pool = tuple(self.prefixes)
+        
+        # 号段前3位 -> 运营商名称，判断运营商时只需一次字典查找
+        self.carrier_by_prefix = {}
+        for carrier_name, carrier_prefixes in (("中国移动", self.mobile_prefixes),
+                                               ("中国联通", self.unicom_prefixes),
+                                               ("中国电信", self.telecom_prefixes),
+                                               ("虚拟运营商", self.virtual_prefixes)):
+            for carrier_prefix in carrier_prefixes:
+                self.carrier_by_prefix.setdefault(carrier_prefix, carrier_name)
+        
+        # 号段数据初始化后不再变化，统计信息只计算一次
+        self.statistics = {
+            "总号段数": len(self.prefixes),
+            "中国移动号段": len(self.mobile_prefixes),
+            "中国联通号段": len(self.unicom_prefixes),
+            "中国电信号段": len(self.telecom_prefixes),
+            "虚拟运营商号段": len(self.virtual_prefixes)
+        }
 
     def generate_phone_number(self, prefix=None, carrier=None):
         """
@@ -73,29 +113,57 @@ class PhoneGenerator:
             str: 生成的11位手机号码
         """
         # 选择前缀
+        chosen_prefix = self.rng.choice(self.get_prefix_pool(prefix, carrier))
+        
+        # 一次抽取8位随机数字作为后缀，截到11位（4位前缀时取7位）
+        return f"{chosen_prefix}{self.rng.randrange(100000000):08d}"[:11]
+
+    def get_prefix_pool(self, prefix=None, carrier=None):
+        """
+        获取可选的号段前缀列表
+        
+        Args:
+            prefix (str): 指定前缀，为None时按运营商选择
+            carrier (str): 指定运营商
+            
+        Returns:
+            tuple: 前缀候选元组
+        """
         if prefix:
-            if prefix in self.prefixes:
-                chosen_prefix = prefix
-            else:
-                raise ValueError(f"不支持的号段前缀: {prefix}")
-        else:
-            # 根据运营商选择前缀
-            if carrier == "mobile":
-                chosen_prefix = random.choice(self.mobile_prefixes)
-            elif carrier == "unicom":
-                chosen_prefix = random.choice(self.unicom_prefixes)
-            elif carrier == "telecom":
-                chosen_prefix = random.choice(self.telecom_prefixes)
-            elif carrier == "virtual":
-                chosen_prefix = random.choice(self.virtual_prefixes)
-            else:
-                chosen_prefix = random.choice(self.prefixes)
-        
-        # 生成后8位随机数字
-        remaining_digits = 11 - len(chosen_prefix)
-        random_suffix = ''.join([str(random.randint(0, 9)) for _ in range(remaining_digits)])
-        
-        return chosen_prefix + random_suffix
+            if prefix in self.prefix_set:
+                return (prefix,)
+            raise ValueError(f"不支持的号段前缀: {prefix}")
+        
+        # 根据运营商选择前缀
+        return self.prefix_pools.get(carrier, self.all_prefix_pool)
+
+    def generate_phone_batch(self, count, prefix=None, carrier=None):
+        """
+        一次性批量生成手机号码（不去重）
+        
+        Args:
+            count (int): 生成数量
+            prefix (str): 指定前缀
+            carrier (str): 指定运营商
+            
+        Returns:
+            list: 生成的手机号码列表
+        """
+        if count <= 0:
+            return []
+        
+        # 前缀一次性批量抽取，后缀按8位生成
+        pool = self.get_prefix_pool(prefix, carrier)
+        prefixes = self.rng.choices(pool, k=count)
+        # 随机方法绑定为局部变量，省去重复的属性查找和一层方法调用
+        randrange = self.rng.randrange
+        
+        suffix_length = self.suffix_length_by_prefix
+        if all(suffix_length[p] == 8 for p in pool):
+            return [f"{p}{randrange(100000000):08d}" for p in prefixes]
+        
+        # 含4位前缀时截到11位，即为均匀的7位后缀
+        return [f"{p}{randrange(100000000):08d}"[:11] for p in prefixes]
 
     def generate_phone_numbers(self, count, prefix=None, carrier=None, unique=True):
         """
@@ -113,24 +181,23 @@ class PhoneGenerator:
         if count <= 0:
             return []
             
-        phone_numbers = []
-        generated_set = set() if unique else None
+        if not unique:
+            return self.generate_phone_batch(count, prefix, carrier)
         
-        max_attempts = count * 10  # 防止无限循环
-        attempts = 0
+        # 号段空间远大于生成数量，多生成少量号码后去重，通常一次即可凑足
+        oversample = max(16, count // 50)
+        phone_numbers = list(dict.fromkeys(self.generate_phone_batch(count + oversample, prefix, carrier)))
         
+        # 极少数情况下仍不足时补充生成，总生成量不超过原有上限
+        max_attempts = count * 10  # 防止无限循环
+        attempts = count + oversample
         while len(phone_numbers) < count and attempts < max_attempts:
-            phone = self.generate_phone_number(prefix, carrier)
-            
-            if unique and generated_set is not None:
-                if phone not in generated_set:
-                    phone_numbers.append(phone)
-                    generated_set.add(phone)
-            else:
-                phone_numbers.append(phone)
-                
-            attempts += 1
-            
+            extra = count - len(phone_numbers) + oversample
+            attempts += extra
+            phone_numbers.extend(self.generate_phone_batch(extra, prefix, carrier))
+            phone_numbers = list(dict.fromkeys(phone_numbers))
+        
+        del phone_numbers[count:]
         return phone_numbers
 
     def get_carrier_name(self, phone_number):
@@ -146,29 +213,28 @@ class PhoneGenerator:
         if not phone_number or len(phone_number) < 3:
             return "未知"
             
-        prefix = phone_number[:3]
-        
-        if prefix in self.mobile_prefixes:
-            return "中国移动"
-        elif prefix in self.unicom_prefixes:
-            return "中国联通"
-        elif prefix in self.telecom_prefixes:
-            return "中国电信"
-        elif prefix in self.virtual_prefixes:
-            return "虚拟运营商"
-        else:
-            return "未知运营商"
+        return self.carrier_by_prefix.get(phone_number[:3], "未知运营商")
+
+    def classify_many(self, phone_numbers):
+        """
+        批量判断手机号码的运营商
+        
+        Args:
+            phone_numbers (list): 手机号码列表
+            
+        Returns:
+            list: 与输入顺序对应的运营商名称列表
+        """
+        get_carrier = self.carrier_by_prefix.get
+        return [get_carrier(phone[:3], "未知运营商") if len(phone) >= 3 else "未知"
+                for phone in phone_numbers]
 
     def get_statistics(self):
         """获取号段统计信息"""
-        return {
-            "总号段数": len(self.prefixes),
-            "中国移动号段": len(self.mobile_prefixes),
-            "中国联通号段": len(self.unicom_prefixes),
-            "中国电信号段": len(self.telecom_prefixes),
-            "虚拟运营商号段": len(self.virtual_prefixes),
-            "支持的前缀": self.prefixes
-        }
+        # 返回副本，调用方修改结果不会影响缓存及号段列表
+        stats = dict(self.statistics)
+        stats["支持的前缀"] = list(self.prefixes)
+        return stats
 
 
 class NameGenerator:
@@ -176,6 +242,8 @@ class NameGenerator:
     
     def __init__(self):
         """初始化姓名数据库"""
+        self.rng = random.Random()
+        
         # 男性双字名数组 (386个)
         self.boy2 = [
             "煜洋", "雨泽", "越泽", "之玉", "锦程", "修杰", "烨伟", "尔曼", "立辉", "致远", "天思", "友绿", "聪健", "修洁", "平灵", "源智", "烨华", "振家", "越彬",
@@ -235,19 +303,44 @@ class NameGenerator:
         self.girl1 = [
             "美", "娜", "秀", "雯", "蕾", "洁", "思", "慧", "心", "涵", "静", "英", "晓", "琳", "珊", "莉", "佳", "婷", "璐", "晨", "安", "包", "贝", "冰", "蓓", "珂", "柏", "琳", "菲", "怡", "娜", "心", "洁", "梓", "瑶", "珊", "艾", "诗", "璐", "倩", "苏", "雯", "婧", "秀", "慧", "彤", "媛", "美", "晶", "琪", "云", "萍", "蕾", "莉", "莹", "薇", "楠", "楚", "佳", "爽", "卓", "格", "斌", "羽", "茜", "婷", "琦", "绮", "燕", "张", "青", "红", "翠", "帆", "离", "莲", "宜", "园", "冬", "霜"
         ]
+        
+        # 批量生成用的名字表：双字名和单字名合并，按权重使双字名总概率保持70%
+        self.boy_given_pool, self.boy_given_weights = self.build_given_name_table(self.boy2, self.boy1)
+        self.girl_given_pool, self.girl_given_weights = self.build_given_name_table(self.girl2, self.girl1)
+        
+        # 姓名数据初始化后不再变化，统计信息只计算一次
+        self.statistics = {
+            "姓氏数量": len(self.xing),
+            "男性双字名": len(self.boy2),
+            "男性单字名": len(self.boy1),
+            "女性双字名": len(self.girl2),
+            "女性单字名": len(self.girl1),
+            "理论组合数": {
+                "男性双字名组合": len(self.xing) * len(self.boy2),
+                "男性单字名组合": len(self.xing) * len(self.boy1),
+                "女性双字名组合": len(self.xing) * len(self.girl2),
+                "女性单字名组合": len(self.xing) * len(self.girl1)
+            }
+        }
+
+    @staticmethod
+    def build_given_name_table(double_names, single_names):
+        """合并双字名和单字名，返回(名字元组, 累计权重列表)"""
+        double_weight = DOUBLE_NAME_PROBABILITY / len(double_names)
+        single_weight = (1 - DOUBLE_NAME_PROBABILITY) / len(single_names)
+        weights = [double_weight] * len(double_names) + [single_weight] * len(single_names)
+        return tuple(double_names) + tuple(single_names), list(accumulate(weights))
 
     def get_random_from_array(self, array):
         """从数组中随机选择一个元素"""
-        return random.choice(array)
+        return self.rng.choice(array)
 
     def make_boy_name(self):
         """生成男性姓名"""
         first = self.get_random_from_array(self.xing)
         
         # 70%概率生成双字名，30%概率生成单字名
-        choice = 1 if random.random() < 0.7 else 2
-        
-        if choice == 1:
+        if self.rng.random() < DOUBLE_NAME_PROBABILITY:
             second = self.get_random_from_array(self.boy2)
         else:
             second = self.get_random_from_array(self.boy1)
@@ -259,9 +352,7 @@ class NameGenerator:
         first = self.get_random_from_array(self.xing)
         
         # 70%概率生成双字名，30%概率生成单字名
-        choice = 1 if random.random() < 0.7 else 2
-        
-        if choice == 1:
+        if self.rng.random() < DOUBLE_NAME_PROBABILITY:
             second = self.get_random_from_array(self.girl2)
         else:
             second = self.get_random_from_array(self.girl1)
@@ -279,41 +370,58 @@ class NameGenerator:
         Returns:
             list: 生成的姓名列表
         """
-        if num <= 0:
-            return []
+        return self.generate_names_with_counts(num, gender)[0]
+    
+    def generate_names_with_counts(self, num, gender="all"):
+        """
+        生成姓名并同时统计男女数量，调用方无需再按名字反查性别
+        
+        Args:
+            num (int): 生成数量
+            gender (str): 性别选择 - "boy", "girl", "all"
             
-        names = []
-        
-        for _ in range(num):
-            if gender == "boy":
-                names.append(self.make_boy_name())
-            elif gender == "girl":
-                names.append(self.make_girl_name())
-            elif gender == "all":
-                # 随机选择男性或女性姓名
-                choice = random.randint(1, 2)
-                if choice == 1:
-                    names.append(self.make_boy_name())
-                else:
-                    names.append(self.make_girl_name())
-                    
-        return names
+        Returns:
+            tuple: (姓名列表, 男性数量, 女性数量)
+        """
+        if num <= 0 or gender not in ("boy", "girl", "all"):
+            return [], 0, 0
+        
+        choices = self.rng.choices
+        
+        # 先确定男女数量，再对姓氏和名字各做一次批量加权抽样
+        if gender == "boy":
+            is_boy = None
+            boy_count = num
+        elif gender == "girl":
+            is_boy = None
+            boy_count = 0
+        else:
+            # 每个姓名各以50%概率为男性或女性
+            is_boy = choices((True, False), k=num)
+            boy_count = sum(is_boy)
+        
+        boy_given = choices(self.boy_given_pool, cum_weights=self.boy_given_weights, k=boy_count)
+        girl_given = choices(self.girl_given_pool, cum_weights=self.girl_given_weights, k=num - boy_count)
+        
+        if is_boy is None:
+            given_names = boy_given or girl_given
+        else:
+            # 按性别序列依次取用对应的名字，保持男女交错的随机顺序
+            next_boy = iter(boy_given).__next__
+            next_girl = iter(girl_given).__next__
+            given_names = [next_boy() if boy else next_girl() for boy in is_boy]
+        
+        surnames = choices(self.xing, k=num)
+        names = [first + second for first, second in zip(surnames, given_names)]
+        
+        return names, boy_count, num - boy_count
 
     def get_statistics(self):
         """获取姓名数据库统计信息"""
-        return {
-            "姓氏数量": len(self.xing),
-            "男性双字名": len(self.boy2),
-            "男性单字名": len(self.boy1),
-            "女性双字名": len(self.girl2),
-            "女性单字名": len(self.girl1),
-            "理论组合数": {
-                "男性双字名组合": len(self.xing) * len(self.boy2),
-                "男性单字名组合": len(self.xing) * len(self.boy1),
-                "女性双字名组合": len(self.xing) * len(self.girl2),
-                "女性单字名组合": len(self.xing) * len(self.girl1)
-            }
-        }
+        # 返回副本，调用方修改结果不会影响缓存
+        stats = dict(self.statistics)
+        stats["理论组合数"] = dict(self.statistics["理论组合数"])
+        return stats
 
 
 if __name__ == "__main__":
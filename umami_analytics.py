@@ -11,13 +11,15 @@ import platform
 import hashlib
 import time
 import threading
-import tempfile
-import shutil
+import queue
 import json
+import logging
 from datetime import datetime
+from functools import lru_cache
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
     HAS_REQUESTS = True
 except ImportError:
     HAS_REQUESTS = False
@@ -31,6 +33,53 @@ except ImportError:
     HAS_GEOIP = False
     print("提示: geoip2库未安装，地理位置功能将被禁用")
 
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# GeoIP数据库文件的查找位置
+GEOIP_DB_PATHS = (
+    '/usr/share/GeoIP/GeoLite2-City.mmdb',
+    '/opt/GeoIP/GeoLite2-City.mmdb',
+    './GeoLite2-City.mmdb'
+)
+
+# 上次检测到的可用API端点
+ENDPOINT_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".infogen", "umami_endpoint")
+
+# 进程内缓存的地理位置查询结果（只保存在内存中，不写入磁盘）
+_cached_location = None
+
+
+@lru_cache(maxsize=None)
+def get_platform_info():
+    """获取系统平台信息（只查询一次；部分平台上platform函数需要启动子进程）"""
+    return {
+        "system": platform.system(),
+        "release": platform.release(),
+        "version": platform.version(),
+        "machine": platform.machine(),
+        "processor": platform.processor()
+    }
+
+
+@lru_cache(maxsize=1)
+def _query_screen_resolution():
+    """查询主屏幕分辨率（每个进程只查询一次）"""
+    from PyQt5.QtWidgets import QApplication
+    size = QApplication.primaryScreen().size()
+    return f"{size.width()}x{size.height()}"
+
+
+def get_screen_resolution():
+    """获取屏幕分辨率，QApplication尚未创建时返回默认分辨率（默认值不缓存）"""
+    try:
+        from PyQt5.QtWidgets import QApplication
+        if QApplication.instance():
+            return _query_screen_resolution()
+    except Exception:
+        pass
+    return "1920x1080"  # 默认分辨率
+
 
 class UmamiAnalytics:
     """桌面应用Umami统计分析类"""
@@ -49,24 +98,34 @@ class UmamiAnalytics:
         self.enabled = HAS_REQUESTS
         
         if not self.enabled:
-            print("统计功能已禁用: 缺少必要依赖")
+            logger.info("统计功能已禁用: 缺少必要依赖")
             return
             
+        # 复用同一个HTTP会话，保持长连接，避免每个事件重新建立TCP/TLS连接
+        self.http = requests.Session()
+        self.http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        self.http.headers.update({"Connection": "keep-alive"})
+        
         # API端点配置
         base_url = umami_url.replace('/script.js', '')
-        self.possible_endpoints = [
+        self.possible_endpoints = (
             f"{base_url}/api/send",
             f"{base_url}/api/collect", 
             f"{base_url}/api/track"
-        ]
+        )
         self.current_endpoint = self.possible_endpoints[0]
         
-        # 会话管理
+        # 会话管理（机器标识只计算一次）
+        self.machine_id = f"{platform.node()}-{get_platform_info()['system']}"
         self.session_id = self._generate_session_id()
         self.user_id = self._generate_user_id()
         self.start_time = time.time()
         self.last_activity = time.time()
         
+        # 事件发送队列及后台发送线程（首个事件时启动）
+        self.event_queue = queue.Queue()
+        self.sender_thread = None
+        
         # 心跳机制
         self.heartbeat_interval = 30  # 30秒心跳
         self.heartbeat_timer = None
@@ -74,31 +133,65 @@ class UmamiAnalytics:
         
         # 系统信息
         self.user_agent = self._get_user_agent()
-        self.screen_resolution = self._get_screen_resolution()
-        self.location_info = self._get_location_info()
+        self.request_headers = {
+            "User-Agent": self.user_agent,
+            "Content-Type": "application/json",
+            "Origin": "https://infogen.desktop"
+        }
+        self.screen_resolution = get_screen_resolution()
         
-        # 检测可用端点
-        self._detect_working_endpoint()
+        # 地理位置查询和端点检测涉及网络请求，放到后台线程完成，不阻塞程序启动；
+        # 完成前先使用默认值，发送线程会等待其完成后再发送事件
+        self.location_info = {"country": "未知", "region": "未知", "city": "未知"}
+        
+        # 每个事件都附带的公共数据，只构造一次（地理位置在后台初始化完成后更新）
+        self.base_event_data = {
+            "session_id": self.session_id,
+            "user_id": self.user_id,
+            "platform": get_platform_info()["system"],
+            "version": "3.0",
+            "location": self.location_info
+        }
+        
+        self.endpoint_from_cache = False
+        self.init_done = threading.Event()
+        init_thread = threading.Thread(target=self._async_init)
+        init_thread.daemon = True
+        init_thread.start()
         
-        print(f"Umami统计模块已初始化 - 会话ID: {self.session_id[:8]}...")
+        logger.info("Umami统计模块已初始化 - 会话ID: %s...", self.session_id[:8])
+    
+    def _async_init(self):
+        """后台初始化：获取地理位置并检测可用端点"""
+        try:
+            self.location_info = self._get_location_info()
+            self.base_event_data["location"] = self.location_info
+            
+            # 优先使用上次检测到的可用端点，省去启动时逐个探测；发送失败时再重新检测
+            cached_endpoint = self._load_cached_endpoint()
+            if cached_endpoint:
+                self.current_endpoint = cached_endpoint
+                self.endpoint_from_cache = True
+            else:
+                self._detect_working_endpoint()
+        finally:
+            self.init_done.set()
     
     def _generate_session_id(self):
         """生成会话ID（每小时更新）"""
-        machine_id = f"{platform.node()}-{platform.system()}"
         current_hour = int(time.time() / 3600)
-        session_string = f"{machine_id}-{current_hour}"
+        session_string = f"{self.machine_id}-{current_hour}"
         return hashlib.md5(session_string.encode()).hexdigest()
     
     def _generate_user_id(self):
         """生成用户ID（基于机器标识）"""
-        machine_id = f"{platform.node()}-{platform.system()}"
-        return hashlib.md5(machine_id.encode()).hexdigest()[:16]
+        return hashlib.md5(self.machine_id.encode()).hexdigest()[:16]
     
     def _get_user_agent(self):
         """获取用户代理字符串"""
-        system = platform.system()
+        system = get_platform_info()["system"]
         if system == "Windows":
-            version = platform.version()
+            version = get_platform_info()["version"]
             return f"Mozilla/5.0 (Windows NT {version}; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         elif system == "Darwin":
             version = platform.mac_ver()[0]
@@ -106,88 +199,68 @@ class UmamiAnalytics:
         else:
             return f"Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     
-    def _get_screen_resolution(self):
-        """获取屏幕分辨率"""
-        try:
-            from PyQt5.QtWidgets import QApplication
-            if QApplication.instance():
-                screen = QApplication.primaryScreen()
-                size = screen.size()
-                return f"{size.width()}x{size.height()}"
-        except:
-            pass
-        return "1920x1080"  # 默认分辨率
-    
     def _get_location_info(self):
-        """获取地理位置信息"""
+        """获取地理位置信息（每个进程只查询一次，之后直接使用内存中的结果）"""
+        global _cached_location
         if not HAS_GEOIP:
             return {"country": "未知", "region": "未知", "city": "未知"}
         
+        if _cached_location is not None:
+            return _cached_location
+        
         try:
             # 获取外网IP
             ip = self._get_external_ip()
             if ip:
-                return self._get_ip_location(ip)
+                location = self._get_ip_location(ip)
+                if location["country"] != "未知":
+                    _cached_location = location
+                return location
         except Exception as e:
-            print(f"获取地理位置失败: {e}")
+            logger.warning("获取地理位置失败: %s", e)
         
         return {"country": "未知", "region": "未知", "city": "未知"}
     
     def _get_external_ip(self):
         """获取外网IP地址"""
         try:
-            response = requests.get('https://api.ipify.org', timeout=3)
+            response = self.http.get('https://api.ipify.org', timeout=3)
             if response.status_code == 200:
                 return response.text.strip()
         except:
             pass
         return None
     
+    def _open_geoip_reader(self):
+        """打开GeoIP数据库，找不到数据库文件时返回None；调用方用完后需关闭"""
+        # 查找GeoIP数据库文件
+        db_path = next((path for path in GEOIP_DB_PATHS if os.path.exists(path)), None)
+        if not db_path:
+            return None
+        
+        if sys.platform == 'win32':
+            # Windows中文路径处理：由Python打开文件后交给reader读取，无需复制临时文件
+            with open(db_path, 'rb') as db_file:
+                return geoip2.database.Reader(db_file, mode=geoip2.database.MODE_FD)
+        return geoip2.database.Reader(db_path)
+    
     def _get_ip_location(self, ip):
-        """根据IP获取地理位置"""
+        """根据IP获取地理位置（只查询一次，查询后立即关闭数据库释放内存）"""
         try:
-            # 查找GeoIP数据库文件
-            db_paths = [
-                '/usr/share/GeoIP/GeoLite2-City.mmdb',
-                '/opt/GeoIP/GeoLite2-City.mmdb',
-                './GeoLite2-City.mmdb'
-            ]
-            
-            db_path = None
-            for path in db_paths:
-                if os.path.exists(path):
-                    db_path = path
-                    break
-            
-            if not db_path:
+            reader = self._open_geoip_reader()
+            if reader is None:
                 return {"country": "未知", "region": "未知", "city": "未知"}
             
-            # Windows中文路径处理
-            if sys.platform == 'win32':
-                temp_fd, temp_path = tempfile.mkstemp(suffix='.mmdb', prefix='geoip_')
-                os.close(temp_fd)
-                shutil.copy2(db_path, temp_path)
-                db_path = temp_path
-            
-            with geoip2.database.Reader(db_path) as reader:
+            with reader:
                 response = reader.city(ip)
-                result = {
+                return {
                     "country": response.country.names.get('zh-CN', response.country.name or '未知'),
                     "region": response.subdivisions.most_specific.names.get('zh-CN', response.subdivisions.most_specific.name or '未知'),
                     "city": response.city.names.get('zh-CN', response.city.name or '未知')
                 }
                 
-                # 清理临时文件
-                if sys.platform == 'win32' and 'temp_path' in locals():
-                    try:
-                        os.unlink(temp_path)
-                    except:
-                        pass
-                
-                return result
-                
         except Exception as e:
-            print(f"IP地理位置查询失败: {e}")
+            logger.warning("IP地理位置查询失败: %s", e)
             return {"country": "未知", "region": "未知", "city": "未知"}
     
     def _detect_working_endpoint(self):
@@ -197,19 +270,40 @@ class UmamiAnalytics:
             
         for endpoint in self.possible_endpoints:
             try:
-                response = requests.options(endpoint, timeout=3)
+                response = self.http.options(endpoint, timeout=3)
                 if response.status_code in [200, 405]:
                     self.current_endpoint = endpoint
-                    print(f"使用API端点: {endpoint}")
+                    self._save_cached_endpoint(endpoint)
+                    logger.info("使用API端点: %s", endpoint)
                     return
             except:
                 continue
         
-        print(f"使用默认端点: {self.current_endpoint}")
+        logger.info("使用默认端点: %s", self.current_endpoint)
+    
+    def _load_cached_endpoint(self):
+        """读取上次检测到的可用端点，不存在或不属于当前服务器时返回None"""
+        try:
+            with open(ENDPOINT_CACHE_FILE, 'r', encoding='utf-8') as f:
+                endpoint = f.read().strip()
+            if endpoint in self.possible_endpoints:
+                return endpoint
+        except Exception:
+            pass
+        return None
+    
+    def _save_cached_endpoint(self, endpoint):
+        """保存检测到的可用端点"""
+        try:
+            os.makedirs(os.path.dirname(ENDPOINT_CACHE_FILE), exist_ok=True)
+            with open(ENDPOINT_CACHE_FILE, 'w', encoding='utf-8') as f:
+                f.write(endpoint)
+        except Exception as e:
+            logger.warning("保存端点缓存失败: %s", e)
     
     def _send_event(self, event_type, event_name, event_data=None):
         """
-        发送统计事件
+        发送统计事件（放入发送队列，由后台线程依次发送）
         
         Args:
             event_type (str): 事件类型 - "pageview" 或 "event"
@@ -219,76 +313,103 @@ class UmamiAnalytics:
         if not self.enabled:
             return
             
-        def send_request():
-            try:
-                if event_type == "pageview":
-                    payload = {
-                        "type": "event",  # 修正：所有事件都使用"event"类型
-                        "payload": {
-                            "website": self.website_id,
-                            "hostname": "infogen.desktop",
-                            "url": f"/app/{event_name}",
-                            "title": f"InfoGen - {event_name}",
-                            "referrer": "",
-                            "screen": self.screen_resolution
-                        }
-                    }
-                    # 添加自定义数据
-                    if event_data:
-                        payload["payload"]["data"] = {
-                            "session_id": self.session_id,
-                            "user_id": self.user_id,
-                            "platform": platform.system(),
-                            "version": "3.0",
-                            "location": self.location_info,
-                            **event_data
-                        }
-                else:
-                    payload = {
-                        "type": "event",  # 保持event类型
-                        "payload": {
-                            "website": self.website_id,
-                            "hostname": "infogen.desktop",
-                            "name": event_name
-                        }
-                    }
-                    # 添加自定义数据
-                    if event_data:
-                        payload["payload"]["data"] = {
-                            "session_id": self.session_id,
-                            "user_id": self.user_id,
-                            "platform": platform.system(),
-                            "version": "3.0",
-                            "location": self.location_info,
-                            **event_data
-                        }
-                
-                headers = {
-                    "User-Agent": self.user_agent,
-                    "Content-Type": "application/json",
-                    "Origin": "https://infogen.desktop"
+        # 异步发送，避免阻塞主线程；所有事件共用一个后台线程，不再每个事件新建线程
+        self.event_queue.put((event_type, event_name, event_data))
+        if self.sender_thread is None:
+            self.sender_thread = threading.Thread(target=self._send_worker)
+            self.sender_thread.daemon = True
+            self.sender_thread.start()
+    
+    def _build_payload(self, event_type, event_name, event_data):
+        """构造统计事件的请求数据"""
+        if event_type == "pageview":
+            payload = {
+                "type": "event",  # 修正：所有事件都使用"event"类型
+                "payload": {
+                    "website": self.website_id,
+                    "hostname": "infogen.desktop",
+                    "url": f"/app/{event_name}",
+                    "title": f"InfoGen - {event_name}",
+                    "referrer": "",
+                    "screen": self.screen_resolution
                 }
-                
-                # 发送请求
-                response = requests.post(
-                    self.current_endpoint,
-                    json=payload,
-                    headers=headers,
-                    timeout=5
-                )
+            }
+        else:
+            payload = {
+                "type": "event",  # 保持event类型
+                "payload": {
+                    "website": self.website_id,
+                    "hostname": "infogen.desktop",
+                    "name": event_name
+                }
+            }
+        
+        # 添加自定义数据
+        if event_data:
+            payload["payload"]["data"] = {**self.base_event_data, **event_data}
+        return payload
+    
+    def _send_worker(self):
+        """后台发送线程：依次取出队列中的事件并通过共用会话发送，收到None时退出"""
+        # 等待后台初始化完成，使事件带上实际的地理位置并发往检测到的端点
+        self.init_done.wait()
+        while True:
+            item = self.event_queue.get()
+            if item is None:
+                return
+            event_type, event_name, event_data = item
+            try:
+                payload = self._build_payload(event_type, event_name, event_data)
+                response = self._post_event(payload)
                 
                 if response.status_code == 200:
-                    print(f"统计事件发送成功: {event_name}")
+                    logger.debug("统计事件发送成功: %s", event_name)
                 else:
-                    print(f"统计事件发送失败: {event_name} - 状态码: {response.status_code}")
+                    logger.warning("统计事件发送失败: %s - 状态码: %s", event_name, response.status_code)
                     
             except Exception as e:
-                print(f"统计事件发送异常: {event_name} - {e}")
+                logger.warning("统计事件发送异常: %s - %s", event_name, e)
+    
+    def _post_event(self, payload):
+        """发送一个事件；使用缓存的端点失败时，重新检测端点后再发送一次"""
+        try:
+            response = self.http.post(
+                self.current_endpoint,
+                json=payload,
+                headers=self.request_headers,
+                timeout=5
+            )
+            if response.status_code == 200 or not self.endpoint_from_cache:
+                return response
+        except Exception:
+            if not self.endpoint_from_cache:
+                raise
         
-        # 异步发送，避免阻塞主线程
-        thread = threading.Thread(target=send_request)
-        thread.daemon = True
-        thread.start()
+        # 缓存的端点已失效，重新检测（只进行一次）
+        self.endpoint_from_cache = False
+        self._detect_working_endpoint()
+        return self.http.post(
+            self.current_endpoint,
+            json=payload,
+            headers=self.request_headers,
+            timeout=5
+        )
+    
+    def _flush_events(self, timeout=0.2):
+        """
+        结束发送线程，并尽量等待队列中已有的事件发送完毕（在界面线程调用，只做短暂等待）
+        
+        Args:
+            timeout (float): 最长等待时间（秒），避免网络异常时拖慢程序退出
+        """
+        if not self.enabled or self.sender_thread is None:
+            return
+        self.event_queue.put(None)
+        
+        # 后台初始化（端点检测等网络请求）尚未完成时事件无法立即发出，不再等待
+        if not self.init_done.is_set():
+            return
+        self.sender_thread.join(timeout)
     
     def _start_heartbeat(self):
         """启动心跳监控（已禁用）"""
@@ -306,13 +427,7 @@ class UmamiAnalytics:
         self._send_event("pageview", "应用启动", {
             "start_time": datetime.now().isoformat(),
             "python_version": sys.version,
-            "platform_info": {
-                "system": platform.system(),
-                "release": platform.release(),
-                "version": platform.version(),
-                "machine": platform.machine(),
-                "processor": platform.processor()
-            }
+            "platform_info": get_platform_info()
         })
         
         # 同时发送一个event类型的事件用于测试
@@ -335,6 +450,9 @@ class UmamiAnalytics:
         
         # 停止心跳监控
         self._stop_heartbeat()
+        
+        # 退出前尽量把排队中的事件（包括关闭事件）发送出去
+        self._flush_events()
     
     def track_about_page_view(self):
         """追踪关于页面访问"""
@@ -6,10 +6,57 @@ VCF通讯录生成器 - 标准VCF格式文件生成
 """
 
 import os
+import sys
 import random
 from datetime import datetime
 from name_generator import NameGenerator, PhoneGenerator
 
+# 文件写入缓冲区大小及每批编码写入的联系人数量
+WRITE_BUFFER_SIZE = 1 << 20
+WRITE_BATCH_SIZE = 1000
+
+# 联系人总数达到该值时使用多进程并行生成。单进程生成约3.4微秒/人，该规模串行约需1.7秒；
+# 进程池以spawn方式启动（Windows/macOS默认，打包后还需重新运行引导程序）每个进程需0.1~0.3秒以上，
+# 规模较小时（如界面默认的5个文件×1000人，串行约15毫秒）启动开销远大于收益
+PARALLEL_CONTACT_THRESHOLD = 500000
+
+# Windows上进程池最多支持61个工作进程
+WINDOWS_MAX_WORKERS = 61
+
+
+def format_vcf_entry(name, phone):
+    """
+    格式化单个联系人的VCF条目（单条预览与批量写入共用同一格式）
+    
+    Args:
+        name (str): 联系人姓名
+        phone (str): 联系人电话
+        
+    Returns:
+        str: VCF格式的联系人条目
+    """
+    # 格式化电话号码为 xxx xxxx xxxx 格式
+    formatted_phone = f"{phone[:3]} {phone[3:7]} {phone[7:]}" if len(phone) == 11 else phone
+    
+    return (f"BEGIN:VCARD\nVERSION:3.0\nFN:{name}\nN:{name[0]};{name[1:]};;;\n"
+            f"TEL;CELL:{phone}\nTEL;CELL;TYPE=VOICE:{formatted_phone}\nEND:VCARD\n")
+
+
+# 多进程生成时每个工作进程各自持有的生成器
+_worker_generator = None
+
+
+def _init_worker():
+    """工作进程初始化：创建本进程使用的生成器（随机数种子各自独立）"""
+    global _worker_generator
+    _worker_generator = VCFGenerator()
+
+
+def _generate_one_file(args):
+    """工作进程中生成单个VCF文件，返回(文件路径, 是否成功)"""
+    filepath = args[0]
+    return filepath, _worker_generator.generate_vcf_file(*args)
+
 
 class VCFGenerator:
     """VCF通讯录文件生成器类"""
@@ -30,18 +77,7 @@ class VCFGenerator:
         Returns:
             str: VCF格式的联系人条目
         """
-        # 格式化电话号码为 xxx xxxx xxxx 格式
-        formatted_phone = f"{phone[:3]} {phone[3:7]} {phone[7:]}" if len(phone) == 11 else phone
-        
-        vcf_entry = f"""BEGIN:VCARD
-VERSION:3.0
-FN:{name}
-N:{name[0]};{name[1:]};;;
-TEL;CELL:{phone}
-TEL;CELL;TYPE=VOICE:{formatted_phone}
-END:VCARD
-"""
-        return vcf_entry
+        return format_vcf_entry(name, phone)
     
     def generate_contacts(self, count, gender="all", carrier=None, unique_phones=True):
         """
@@ -71,29 +107,63 @@ END:VCARD
         
         return contacts
     
-    def create_vcf_file(self, contacts, filename, encoding='utf-8'):
+    def create_vcf_file(self, contacts, filename, encoding='utf-8', buffer_size=WRITE_BUFFER_SIZE):
         """
         创建VCF文件
         
         Args:
-            contacts (list): 联系人列表
+            contacts (list): 联系人列表（需支持切片）
             filename (str): 文件名
             encoding (str): 文件编码
+            buffer_size (int): 写入缓冲区大小（字节）
             
         Returns:
             bool: 是否创建成功
         """
         try:
-            with open(filename, 'w', encoding=encoding) as file:
-                for name, phone in contacts:
-                    vcf_entry = self.create_contact_vcf_entry(name, phone)
-                    file.write(vcf_entry)
-                    file.write('\n')  # 在联系人之间添加空行
+            with open(filename, 'wb', buffering=buffer_size) as file:
+                # 按批切片，每批用列表推导格式化条目后拼接编码，只写入一次
+                for start in range(0, len(contacts), WRITE_BATCH_SIZE):
+                    batch = [format_vcf_entry(name, phone)
+                             for name, phone in contacts[start:start + WRITE_BATCH_SIZE]]
+                    file.write(self._encode_batch(batch, encoding))
             return True
         except Exception as e:
             print(f"创建VCF文件失败: {e}")
             return False
     
+    @staticmethod
+    def _encode_batch(batch, encoding):
+        """拼接并编码一批VCF条目（条目后各跟一个空行），换行符与文本模式写入保持一致"""
+        text = '\n'.join(batch) + '\n'
+        if os.linesep != '\n':
+            text = text.replace('\n', os.linesep)
+        return text.encode(encoding)
+    
+    def generate_vcf_file(self, filepath, contacts_per_file, gender="all", carrier=None,
+                          unique_phones=True, buffer_size=WRITE_BUFFER_SIZE):
+        """
+        生成联系人并写入单个VCF文件
+        
+        Args:
+            filepath (str): 文件路径
+            contacts_per_file (int): 联系人数量
+            gender (str): 性别选择
+            carrier (str): 运营商选择
+            unique_phones (bool): 是否确保电话号码唯一
+            buffer_size (int): 文件写入缓冲区大小（字节）
+            
+        Returns:
+            bool: 是否创建成功
+        """
+        contacts = self.generate_contacts(
+            contacts_per_file, 
+            gender=gender, 
+            carrier=carrier, 
+            unique_phones=unique_phones
+        )
+        return self.create_vcf_file(contacts, filepath, buffer_size=buffer_size)
+    
     def generate_vcf_files(self, file_count, contacts_per_file, 
                           output_dir="vcf_output", 
                           filename_prefix="通讯录",
@@ -103,7 +173,10 @@ END:VCARD
                           progress_callback=None,
                           naming_mode="timestamp",
                           start_number=1,
-                          number_format="{:03d}"):
+                          number_format="{:03d}",
+                          buffer_size=WRITE_BUFFER_SIZE,
+                          create_output_dir=True,
+                          max_workers=None):
         """
         批量生成VCF文件
         
@@ -118,15 +191,19 @@ END:VCARD
             progress_callback (function): 进度回调函数
             naming_mode (str): 命名模式 - "timestamp"(时间戳) 或 "custom_number"(自定义序号)
             start_number (int): 自定义序号模式的起始数字
-            number_format (str): 数字格式化字符串，如"{:03d}"表示3位数补零
+            number_format (str|callable): 数字格式化字符串，如"{:03d}"表示3位数补零；
+                也可传入接收数字、返回字符串的函数
+            buffer_size (int): 文件写入缓冲区大小（字节）
+            create_output_dir (bool): 是否检查并创建输出目录，目录已确定存在时可传False跳过
+            max_workers (int): 并行生成的进程数，默认为CPU核心数，传1则在当前进程依次生成
             
         Returns:
             dict: 生成结果信息
         """
-        # 创建输出目录
-        if not os.path.exists(output_dir):
+        # 创建输出目录（目录已存在时makedirs直接返回，无需先单独检查）
+        if create_output_dir:
             try:
-                os.makedirs(output_dir)
+                os.makedirs(output_dir, exist_ok=True)
             except Exception as e:
                 return {
                     "success": False,
@@ -139,40 +216,45 @@ END:VCARD
             # 时间戳模式（原有逻辑）
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        created_files = []
-        failed_files = []
+        # 序号格式化函数只确定一次，循环内直接调用
+        format_number = number_format if callable(number_format) else number_format.format
         
+        # 先确定全部文件路径，各文件的生成互不依赖；目录与前缀只拼接一次，循环内只拼接变化的后缀
+        path_prefix = os.path.join(output_dir, filename_prefix)
+        filepaths = []
         for i in range(file_count):
-            # 生成联系人
-            contacts = self.generate_contacts(
-                contacts_per_file, 
-                gender=gender, 
-                carrier=carrier, 
-                unique_phones=unique_phones
-            )
-            
             # 根据命名模式生成文件名
             if naming_mode == "custom_number":
                 # 自定义序号模式
                 current_number = start_number + i
-                number_str = number_format.format(current_number)
-                filename = f"{filename_prefix}_{number_str}.vcf"
+                number_str = format_number(current_number)
+                filepaths.append(f"{path_prefix}_{number_str}.vcf")
             else:
                 # 时间戳模式（默认）
-                filename = f"{filename_prefix}_{timestamp}_{i+1:03d}.vcf"
-            
-            filepath = os.path.join(output_dir, filename)
-            
-            # 创建VCF文件
-            if self.create_vcf_file(contacts, filepath):
-                created_files.append(filepath)
-            else:
-                failed_files.append(filepath)
-            
-            # 调用进度回调
-            if progress_callback:
-                progress = (i + 1) / file_count * 100
-                progress_callback(int(progress))
+                filepaths.append(f"{path_prefix}_{timestamp}_{i+1:03d}.vcf")
+        
+        tasks = [(filepath, contacts_per_file, gender, carrier, unique_phones, buffer_size)
+                 for filepath in filepaths]
+        
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if sys.platform == 'win32':
+            max_workers = min(max_workers, WINDOWS_MAX_WORKERS)
+        
+        if file_count > 1 and max_workers > 1 and file_count * contacts_per_file >= PARALLEL_CONTACT_THRESHOLD:
+            # 总工作量较大时分配到多个进程并行生成，绕开GIL；只在此时导入，避免拖慢程序启动
+            # 统一使用spawn启动：调用方通常是界面程序的后台线程，在多线程进程中fork可能死锁，
+            # 各平台也与打包后的Windows程序行为一致
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=min(max_workers, file_count),
+                                     mp_context=multiprocessing.get_context("spawn"),
+                                     initializer=_init_worker) as executor:
+                results = executor.map(_generate_one_file, tasks)
+                created_files, failed_files = self._collect_results(results, file_count, progress_callback)
+        else:
+            results = ((task[0], self.generate_vcf_file(*task)) for task in tasks)
+            created_files, failed_files = self._collect_results(results, file_count, progress_callback)
         
         return {
             "success": len(failed_files) == 0,
@@ -184,6 +266,24 @@ END:VCARD
             "total_contacts": len(created_files) * contacts_per_file
         }
     
+    @staticmethod
+    def _collect_results(results, file_count, progress_callback):
+        """按文件顺序汇总生成结果并回调进度，返回(成功文件列表, 失败文件列表)"""
+        # 结果数量已知，预先分配后按序号填入，最后一次性分成成功和失败两组
+        outcomes = [None] * file_count
+        
+        for i, outcome in enumerate(results):
+            outcomes[i] = outcome
+            
+            # 调用进度回调
+            if progress_callback:
+                progress = (i + 1) / file_count * 100
+                progress_callback(int(progress))
+        
+        created_files = [filepath for filepath, success in outcomes if success]
+        failed_files = [filepath for filepath, success in outcomes if not success]
+        return created_files, failed_files
+    
     def preview_vcf_content(self, count=3, gender="all", carrier=None):
         """
         生成VCF内容预览
@@ -197,13 +297,9 @@ END:VCARD
             str: VCF内容预览
         """
         contacts = self.generate_contacts(count, gender, carrier)
-        preview_content = ""
-        
-        for name, phone in contacts:
-            preview_content += self.create_contact_vcf_entry(name, phone)
-            preview_content += "\n"
         
-        return preview_content
+        # 每个条目后跟一个空行，一次拼接完成
+        return "".join([format_vcf_entry(name, phone) + "\n" for name, phone in contacts])
     
     def get_generation_info(self, file_count, contacts_per_file):
         """